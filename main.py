@@ -1,9 +1,20 @@
 import sys
 import os
+import bisect
+import heapq
 import json
+import mmap
+import re
 import subprocess
 import shutil
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
 from pathlib import Path
+from collections import OrderedDict
+from contextlib import closing
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
@@ -12,18 +23,25 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox, QSystemTrayIcon, QMenu, QStyle,
     QDialogButtonBox, QSystemTrayIcon, QMenu, QStyle,
     QTableWidget, QTableWidgetItem, QHeaderView, QScrollArea, QLayout,
-    QCheckBox, QAbstractButton
+    QCheckBox, QAbstractButton, QListView, QStyledItemDelegate, QWidgetItem
 )
 from PyQt6.QtGui import (
     QIcon, QPixmap, QAction, QShortcut, QKeySequence, QPalette, QColor,
-    QPainter, QBrush, QPen
+    QPainter, QBrush, QPen, QFont, QFontMetrics, QLinearGradient, QImage,
+    QImageReader, QPixmapCache
 )
 from PyQt6.QtCore import (
-    Qt, QSize, QEvent, QPropertyAnimation, QPoint, QRect, QTimer,
-    QEasingCurve
+    Qt, QSize, QEvent, QPropertyAnimation, QPoint, QRect, QRectF, QTimer,
+    QEasingCurve, QAbstractListModel, QModelIndex, QObject, QRunnable,
+    QThreadPool, pyqtSignal
 )
 from PyQt6.QtWidgets import QGraphicsOpacityEffect
 
+try:
+    import numpy as np
+except ImportError:  # optional: only used to score very large catalogs
+    np = None
+
 CONFIG_FILE = "apps.json"
 ICON_DIR = "icons"
 
@@ -31,12 +49,33 @@ ICON_DIR = "icons"
 # ---------------- Flow Layout ----------------
 
 class FlowLayout(QLayout):
+    """Left-to-right layout that wraps items into rows.
+
+    Spacing and size hints are cached, and item positions are memoized per
+    width until the items change or the layout is invalidated. When every
+    item has the same size, as the app cards do, rows are computed
+    arithmetically instead of walking the items. Trailing spacers set by
+    setWidgets reserve room for widgets not created yet without costing a
+    size hint or a setGeometry each.
+    """
+
+    MAX_WIDTHS = 8  # memoized widths, e.g. the last steps of a window resize
+
     def __init__(self, parent=None, margin=0, spacing=-1):
         super().__init__(parent)
+        self.itemList = []
+        self._hints = None       # item size hints, in item order
+        self._uniform = None     # the common size hint, if all items share one
+        self._space = None       # (horizontal, vertical) spacing
+        self._geometry = {}      # width -> (height, [(x, y), ...] or None when uniform)
+        self._placed = None      # (x, y, columns or width) the items are currently laid out for
+        self._minimum = QSize()
+        self._spacers: list[QSpacerItem] = []
+        self._spacer_count = 0   # trailing items of itemList that are spacers
+        self._spacer_size = QSize()
         if parent is not None:
             self.setContentsMargins(margin, margin, margin, margin)
         self.setSpacing(spacing)
-        self.itemList = []
 
     def __del__(self):
         item = self.takeAt(0)
@@ -45,6 +84,8 @@ class FlowLayout(QLayout):
 
     def addItem(self, item):
         self.itemList.append(item)
+        self._spacer_count = 0  # spacers, if any, are ordinary items from now on
+        self.forget_geometry()
 
     def count(self):
         return len(self.itemList)
@@ -56,9 +97,48 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self.itemList):
+            self._spacer_count = 0
+            self.forget_geometry()
             return self.itemList.pop(index)
         return None
 
+    def setWidgets(self, widgets, spacers=0, spacer_size=QSize()):
+        """Lay out exactly ``widgets`` in order, reusing the items of widgets already present.
+
+        Widgets dropped from the layout keep their parent; the caller decides
+        whether to hide or delete them. ``spacers`` empty slots of
+        ``spacer_size`` follow the widgets, standing in for widgets that
+        have not been created yet.
+        """
+        items = {item.widget(): item for item in self.itemList}
+        new_list = []
+        for widget in widgets:
+            item = items.pop(widget, None)
+            if item is None:
+                self.addChildWidget(widget)
+                item = QWidgetItem(widget)
+            new_list.append(item)
+        while len(self._spacers) < spacers:
+            self._spacers.append(QSpacerItem(0, 0))
+        for spacer in self._spacers[:spacers]:
+            spacer.changeSize(spacer_size.width(), spacer_size.height())
+            new_list.append(spacer)
+        self.itemList = new_list
+        self._spacer_count = spacers
+        self._spacer_size = QSize(spacer_size)
+        self.invalidate()
+
+    def invalidate(self):
+        # Qt calls this when an item's size hint changes, too
+        self.forget_geometry()
+        super().invalidate()
+
+    def forget_geometry(self):
+        self._hints = None
+        self._space = None
+        self._geometry.clear()
+        self._placed = None
+
     def expandingDirections(self):
         return Qt.Orientation(0)
 
@@ -66,8 +146,7 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width):
-        height = self.doLayout(QRect(0, 0, width, 0), True)
-        return height
+        return self.geometry_for(width)[0]
 
     def setGeometry(self, rect):
         super().setGeometry(rect)
@@ -77,36 +156,94 @@ class FlowLayout(QLayout):
         return self.minimumSize()
 
     def minimumSize(self):
+        if self._hints is None:
+            self.cache_hints()
+        return self._minimum + QSize(2 * self.contentsMargins().top(), 2 * self.contentsMargins().top())
+
+    def widget_items(self):
+        return self.itemList[:len(self.itemList) - self._spacer_count]
+
+    def cache_hints(self):
+        items = self.widget_items()
+        hints = [item.sizeHint() for item in items]
         size = QSize()
-        for item in self.itemList:
+        for item in items:
             size = size.expandedTo(item.minimumSize())
-        size += QSize(2 * self.contentsMargins().top(), 2 * self.contentsMargins().top())
-        return size
+        if self._spacer_count:
+            hints.append(self._spacer_size)
+            size = size.expandedTo(self._spacer_size)
+        first = hints[0] if hints else None
+        self._uniform = first if first is not None and all(h == first for h in hints) else None
+        self._hints = hints + [self._spacer_size] * (self._spacer_count - 1) if self._spacer_count else hints
+        self._minimum = size
+        if self._space is None and self.itemList:
+            widget = self.itemList[0].widget()
+            style = widget.style() if widget is not None else QApplication.style()
+            spacing = self.spacing()
+            self._space = (
+                spacing + style.layoutSpacing(QSizePolicy.ControlType.PushButton, QSizePolicy.ControlType.PushButton, Qt.Orientation.Horizontal),
+                spacing + style.layoutSpacing(QSizePolicy.ControlType.PushButton, QSizePolicy.ControlType.PushButton, Qt.Orientation.Vertical),
+            )
+
+    def columns(self, width) -> int:
+        # Same wrapping rule as the general walk: an item fits while it ends
+        # inside rect.right(), and a row always takes at least one item
+        spaceX = self._space[0]
+        return max(1, (width - 1 - self._uniform.width()) // (self._uniform.width() + spaceX) + 1)
+
+    def geometry_for(self, width):
+        """``(height, positions)`` for ``width``, with positions relative to the rect origin."""
+        geometry = self._geometry.get(width)
+        if geometry is not None:
+            return geometry
+        if self._hints is None:
+            self.cache_hints()
+        if not self._hints:
+            geometry = (0, [])
+        elif self._uniform is not None:
+            rows = -(-len(self._hints) // self.columns(width))
+            geometry = (rows * self._uniform.height() + (rows - 1) * self._space[1], None)
+        else:
+            spaceX, spaceY = self._space
+            x = y = lineHeight = 0
+            positions = []
+            for hint in self._hints:
+                nextX = x + hint.width() + spaceX
+                if nextX - spaceX > width - 1 and lineHeight > 0:
+                    x = 0
+                    y = y + lineHeight + spaceY
+                    nextX = hint.width() + spaceX
+                    lineHeight = 0
+                positions.append((x, y))
+                x = nextX
+                lineHeight = max(lineHeight, hint.height())
+            geometry = (y + lineHeight, positions)
+        if len(self._geometry) >= self.MAX_WIDTHS:
+            self._geometry.clear()
+        self._geometry[width] = geometry
+        return geometry
 
     def doLayout(self, rect, testOnly):
-        x = rect.x()
-        y = rect.y()
-        lineHeight = 0
-        spacing = self.spacing()
-
-        for item in self.itemList:
-            wid = item.widget()
-            spaceX = spacing + wid.style().layoutSpacing(QSizePolicy.ControlType.PushButton, QSizePolicy.ControlType.PushButton, Qt.Orientation.Horizontal)
-            spaceY = spacing + wid.style().layoutSpacing(QSizePolicy.ControlType.PushButton, QSizePolicy.ControlType.PushButton, Qt.Orientation.Vertical)
-            nextX = x + item.sizeHint().width() + spaceX
-            if nextX - spaceX > rect.right() and lineHeight > 0:
-                x = rect.x()
-                y = y + lineHeight + spaceY
-                nextX = x + item.sizeHint().width() + spaceX
-                lineHeight = 0
-
-            if not testOnly:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
-
-            x = nextX
-            lineHeight = max(lineHeight, item.sizeHint().height())
-
-        return y + lineHeight - rect.y()
+        height, positions = self.geometry_for(rect.width())
+        if testOnly:
+            return height
+        x0, y0 = rect.x(), rect.y()
+        placed = (x0, y0, self.columns(rect.width()) if positions is None else rect.width())
+        if placed == self._placed:
+            return height  # a resize that keeps every item where it is
+        self._placed = placed
+        if positions is None:
+            size = self._uniform
+            columns = placed[2]
+            stepX = size.width() + self._space[0]
+            stepY = size.height() + self._space[1]
+            for i, item in enumerate(self.widget_items()):
+                row, column = divmod(i, columns)
+                item.setGeometry(QRect(x0 + column * stepX, y0 + row * stepY, size.width(), size.height()))
+        else:
+            for item, hint, (x, y) in zip(self.widget_items(), self._hints, positions):
+                item.setGeometry(QRect(QPoint(x0 + x, y0 + y), hint))
+        return height
 
 CONFIG_FILE = "apps.json"
 ICON_DIR = "icons"
@@ -126,27 +263,167 @@ def open_file_cross_platform(path: str):
         subprocess.Popen(["xdg-open", path])
 
 
-def fuzzy_score(name: str, query: str) -> int:
-    name_l = name.lower()
-    q = query.lower()
-    if not q:
+def normalize_text(text: str) -> str:
+    """Casefolded, NFKC-normalized form used for all search comparisons."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def folded_score(name: str, query: str) -> int:
+    """fuzzy_score for strings that are already normalized."""
+    if not query:
         return 0
     score = 0
-    if q in name_l:
+    if query in name:
         score += 100
+    # Greedy subsequence match, one str.find per query character
     i = 0
-    for ch in name_l:
-        if i < len(q) and ch == q[i]:
-            i += 1
-            score += 5
-    if i == len(q):
+    pos = 0
+    for ch in query:
+        pos = name.find(ch, pos) + 1
+        if not pos:
+            break
+        i += 1
+    score += 5 * i
+    if i == len(query):
         score += 30
-    score += min(len(q), 10)
+    score += min(len(query), 10)
     return score
 
 
+def is_subsequence(query: str, text: str) -> bool:
+    """Whether ``query`` occurs in ``text`` in order, by the same walk as folded_score."""
+    pos = 0
+    for ch in query:
+        pos = text.find(ch, pos) + 1
+        if not pos:
+            return False
+    return True
+
+
+def fuzzy_score(name: str, query: str) -> int:
+    return folded_score(normalize_text(name), normalize_text(query))
+
+
+def icon_source(app_data: dict) -> str:
+    """The file an app's icon is decoded from, or "" if it has none."""
+    icon_path = app_data.get("icon_path")
+    if icon_path and os.path.exists(icon_path):
+        return icon_path
+    app_path = app_data.get("path")
+    if app_path and os.path.exists(app_path):
+        return app_path
+    return ""
+
+
+# Decodes whose reader still has to build the full-size image (anything but
+# JPEG, in practice) are serialized above this size to bound peak memory
+FULL_DECODE_LIMIT = 16 * 1024 * 1024
+full_decode_slot = threading.Semaphore(1)
+
+
+def load_app_image(source: str, size: int = 96) -> QImage | None:
+    """Decode ``source`` to fit ``size`` pixels, or None if it is not an image.
+
+    The reader is given the target size up front, so JPEGs decode at a
+    reduced DCT scale, and multi-size .ico/.icns files use their closest
+    frame. Only touches QImage, so it is safe to call from worker threads.
+    """
+    reader = QImageReader(source)
+    reader.setAutoTransform(True)
+    if reader.imageCount() > 1:
+        jump_to_best_frame(reader, size)
+    full = reader.size()
+    if full.isValid() and (full.width() > size or full.height() > size):
+        reader.setScaledSize(full.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio))
+    if reader.format() not in (b"jpeg", b"jpg") and full.width() * full.height() * 4 > FULL_DECODE_LIMIT:
+        with full_decode_slot:
+            image = reader.read()
+    else:
+        image = reader.read()
+    if image.isNull():
+        return None
+    if image.width() > size or image.height() > size:  # the reader could not tell its size
+        image = image.scaled(
+            size, size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    return image
+
+
+def jump_to_best_frame(reader: QImageReader, size: int):
+    """Select the smallest frame of an .ico/.icns that still covers ``size``."""
+    frames = []
+    for i in range(reader.imageCount()):
+        if not reader.jumpToImage(i):
+            break
+        frames.append((max(reader.size().width(), reader.size().height()), i))
+    covering = [frame for frame in frames if frame[0] >= size]
+    best = min(covering) if covering else max(frames, default=(0, 0))
+    reader.jumpToImage(best[1])
+
+
+def open_app_location(app_data: dict):
+    path = app_data.get("path")
+    if path and os.path.exists(path):
+        folder = os.path.dirname(path)
+        open_file_cross_platform(folder)
+
+
+def build_app_menu(parent: QWidget, app_data: dict, handlers: dict) -> QMenu:
+    """Context menu shared by app cards and the grid view."""
+    menu = QMenu(parent)
+
+    launch_act = QAction("🚀 Launch", parent)
+    launch_act.triggered.connect(handlers["launch"])
+    menu.addAction(launch_act)
+
+    menu.addSeparator()
+
+    fav_text = "Remove from Favorites" if app_data.get("favorite") else "Add to Favorites"
+    fav_act = QAction(f"⭐️ {fav_text}", parent)
+    fav_act.triggered.connect(handlers["toggle_fav"])
+    menu.addAction(fav_act)
+
+    edit_act = QAction("✏️ Edit", parent)
+    edit_act.triggered.connect(handlers["edit"])
+    menu.addAction(edit_act)
+
+    loc_act = QAction("📂 Open File Location", parent)
+    loc_act.triggered.connect(handlers["open_location"])
+    menu.addAction(loc_act)
+
+    menu.addSeparator()
+
+    del_act = QAction("🗑️ Delete", parent)
+    del_act.triggered.connect(handlers["delete"])
+    menu.addAction(del_act)
+
+    return menu
+
+
+def set_text(widget, text: str):
+    """setText that skips the relayout when nothing changed."""
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def set_flag(widget: QWidget, name: str, value: bool):
+    """Set a boolean style property, re-polishing only on change."""
+    if bool(widget.property(name)) != value:
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
+def set_active(widget: QWidget, active: bool):
+    set_flag(widget, "active", active)
+
+
 def animate_star(btn: QPushButton):
-    """Small bounce animation when toggling favourite."""
+    """Small bounce animation when toggling favourite (skipped in performance mode)."""
+    if btn.window().property("performance_mode"):
+        return
     rect = btn.geometry()
     anim = QPropertyAnimation(btn, b"geometry")
     anim.setDuration(140)
@@ -159,11 +436,977 @@ def animate_star(btn: QPushButton):
 
 
 
+# ---------------- Icon Loading ----------------
+
+ICON_CACHE_MB = 64  # default budget, overridable with the "icon_cache_mb" setting
+
+
+class IconCache:
+    """LRU of decoded icon pixmaps bounded by their memory footprint.
+
+    Keys are (resolved path, mtime, size, device pixel ratio), so an icon
+    file that changes on disk is simply a new entry and the stale one ages
+    out. Building a key stats the file, so IconTask does it on the icon
+    pool and IconLoader remembers the result per (app id, icon_path, path,
+    size, dpr); lookups never touch the disk. Sources that fail to decode
+    are cached as None.
+    """
+
+    NONE_COST = 64  # bytes charged for a cached miss
+
+    def __init__(self, max_bytes: int = ICON_CACHE_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(source: str, size: int, dpr: float) -> tuple | None:
+        """The cache key for ``source``, or None if it is gone. Stats the file."""
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            return None
+        return (os.path.realpath(source), mtime, size, dpr)
+
+    @classmethod
+    def cost(cls, pixmap: QPixmap | None) -> int:
+        if pixmap is None:
+            return cls.NONE_COST
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key) -> tuple[bool, QPixmap | None]:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key, pixmap: QPixmap | None):
+        if key in self.entries:
+            self.used -= self.cost(self.entries.pop(key))
+        self.entries[key] = pixmap
+        self.used += self.cost(pixmap)
+        self.trim()
+
+    def set_budget(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.trim()
+
+    def trim(self):
+        while self.used > self.max_bytes and self.entries:
+            _, pixmap = self.entries.popitem(last=False)
+            self.used -= self.cost(pixmap)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.used = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.used,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+THUMBNAIL_FILE = os.path.join(ICON_DIR, "thumbnails.atlas")
+
+
+class ThumbnailStore:
+    """Pre-scaled icons packed into one memory-mapped atlas file.
+
+    Layout: MAGIC, a little-endian uint32 header length, a JSON header
+    mapping "<pixels>:<source path>" to [source mtime_ns, source size,
+    offset, width, height], then raw premultiplied ARGB32 pixels. An entry
+    whose source has changed is a miss; a width of 0 records a source that
+    is not an image. New thumbnails stay in memory until save() rewrites
+    the atlas. Safe to use from the icon pool; save() runs on one thread at
+    a time and holds the lock only to take and swap the entries.
+    """
+
+    MAGIC = b"LTHUMB1\n"
+    MISS = object()  # lookup result when the source has to be decoded
+
+    def __init__(self, path: str = THUMBNAIL_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self._loaded = False
+        self._file = None
+        self._map = None
+        self._base = 0
+        self._entries: dict[str, list] = {}  # key -> [mtime, size, offset, w, h]
+        self._added: dict[str, list] = {}    # key -> [mtime, size, pixels, w, h]
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._added)
+
+    @staticmethod
+    def _key(source: str, pixels: int) -> str:
+        return f"{pixels}:{os.path.realpath(source)}"
+
+    def _open(self):
+        self._loaded = True
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # ValueError: empty file
+            f.close()
+            return
+        try:
+            if mapped[:len(self.MAGIC)] != self.MAGIC:
+                raise ValueError("not a thumbnail atlas")
+            start = len(self.MAGIC)
+            length = int.from_bytes(mapped[start:start + 4], "little")
+            entries = json.loads(mapped[start + 4:start + 4 + length])
+            base = start + 4 + length
+            for mtime, size, offset, width, height in entries.values():
+                if offset < 0 or width < 0 or height < 0 or base + offset + width * height * 4 > len(mapped):
+                    raise ValueError("thumbnail outside the atlas")
+        except (ValueError, TypeError, AttributeError):  # a truncated or damaged atlas is dropped
+            mapped.close()
+            f.close()
+            return
+        self._file, self._map = f, mapped
+        self._base = base
+        self._entries = entries
+
+    def _close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._file = self._map = None
+        self._entries = {}
+        self._loaded = False
+
+    def _pixels(self, entry) -> bytes:
+        data = entry[2]
+        if isinstance(data, bytes):
+            return data
+        start = self._base + data
+        return self._map[start:start + entry[3] * entry[4] * 4]
+
+    def lookup(self, source: str, pixels: int):
+        """The stored thumbnail as a QImage, None for a non-image, or MISS."""
+        try:
+            st = os.stat(source)
+        except OSError:
+            return self.MISS
+        key = self._key(source, pixels)
+        with self.lock:
+            if not self._loaded:
+                self._open()
+            entry = self._added.get(key) or self._entries.get(key)
+            if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                return self.MISS
+            width, height = entry[3], entry[4]
+            if not width:
+                return None
+            data = self._pixels(entry)
+        if len(data) != width * height * 4:
+            return self.MISS
+        image = QImage(data, width, height, width * 4, QImage.Format.Format_ARGB32_Premultiplied)
+        return image.copy()  # detach from ``data``
+
+    def add(self, source: str, pixels: int, image: QImage | None):
+        try:
+            st = os.stat(source)
+        except OSError:
+            return
+        if image is None:
+            data, width, height = b"", 0, 0
+        else:
+            image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+            width, height = image.width(), image.height()
+            bits = image.constBits()
+            bits.setsize(image.sizeInBytes())
+            data = bytes(bits)
+        with self.lock:
+            self._added[self._key(source, pixels)] = [st.st_mtime_ns, st.st_size, data, width, height]
+
+    def save(self):
+        """Rewrite the atlas with the new thumbnails, dropping deleted sources.
+
+        Only save() closes the mapping, so the old pixels can be read
+        without the lock while lookups and adds go on.
+        """
+        with self.lock:
+            if not self._added:
+                return
+            if not self._loaded:
+                self._open()
+            added = dict(self._added)
+            merged = {**self._entries, **added}
+        entries, chunks, offset = {}, [], 0
+        for key, entry in merged.items():
+            if not os.path.exists(key.split(":", 1)[1]):
+                continue
+            data = self._pixels(entry)
+            entries[key] = [entry[0], entry[1], offset, entry[3], entry[4]]
+            chunks.append(data)
+            offset += len(data)
+        header = json.dumps(entries).encode("utf-8")
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(self.MAGIC)
+                f.write(len(header).to_bytes(4, "little"))
+                f.write(header)
+                for data in chunks:
+                    f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            with self.lock:
+                self._close()  # the mapping has to go before replacing the file on Windows
+                os.replace(tmp_path, self.path)
+                for key, entry in added.items():
+                    if self._added.get(key) is entry:  # not replaced while writing
+                        del self._added[key]
+        except OSError:
+            return  # thumbnails are only a cache; try again next time
+
+
+class IconTask(QRunnable):
+    """Decodes one app icon on the icon pool, via the thumbnail store.
+
+    Finding the icon file and its cache key stats the disk, so that is done
+    here too; ``key`` is None afterwards if the app has no icon.
+    """
+
+    def __init__(self, app_id, request, thumbnails, signals):
+        super().__init__()
+        self.setAutoDelete(False)  # kept alive by IconLoader.pending
+        self.app_id = app_id
+        self.request = request  # (icon_path, path, size, dpr)
+        self.key = None
+        self.thumbnails = thumbnails
+        self.signals = signals
+
+    def run(self):
+        icon_path, app_path, size, dpr = self.request
+        source = icon_source({"icon_path": icon_path, "path": app_path})
+        self.key = IconCache.key(source, size, dpr) if source else None
+        if self.key is None:
+            self.signals.decoded.emit(self, None)
+            return
+        path = self.key[0]
+        pixels = round(size * dpr)
+        image = self.thumbnails.lookup(path, pixels)
+        if image is ThumbnailStore.MISS:
+            image = load_app_image(path, pixels)
+            self.thumbnails.add(path, pixels, image)
+        if image is not None:
+            image.setDevicePixelRatio(dpr)
+        self.signals.decoded.emit(self, image)
+
+
+class IconSignals(QObject):
+    decoded = pyqtSignal(object, object)  # IconTask, QImage or None
+
+
+class IconLoader(QObject):
+    """Serves app icons from an IconCache, decoding misses off the UI thread.
+
+    At most one load is pending per app; requesting again replaces it and
+    cancelling drops it, so late results for stale requests are discarded.
+    The cache key each app resolved to is remembered, so painting a tile
+    never touches the disk; forget() an app when its icon may have changed.
+    """
+
+    LOADING = object()  # request result while the icon is being decoded
+
+    icon_ready = pyqtSignal(int, object)  # app id, QPixmap or None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cache = IconCache()
+        self.thumbnails = ThumbnailStore()
+        self.dpr = 1.0
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, min(4, QThreadPool.globalInstance().maxThreadCount())))
+        self.pending: dict[int, IconTask] = {}
+        self.keys: dict[int, tuple] = {}  # app id -> (request, cache key or None)
+        self.signals = IconSignals(self)
+        self.signals.decoded.connect(self._on_decoded)
+
+        # New thumbnails are written out once decoding has been quiet for a bit,
+        # on their own thread so rewriting the atlas never stalls the UI
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(2000)
+        self.save_timer.timeout.connect(self.save_thumbnails)
+
+    def request(self, app_data: dict, size: int = 96):
+        """Return the app's pixmap, None if it has no icon, or LOADING.
+
+        LOADING is followed by an icon_ready signal for the app.
+        """
+        app_id = app_data["id"]
+        request = (app_data.get("icon_path"), app_data.get("path"), size, self.dpr)
+        known = self.keys.get(app_id)
+        if known is not None and known[0] == request:
+            key = known[1]
+            if key is None:
+                self.cancel(app_id)
+                return None
+            found, pixmap = self.cache.get(key)
+            if found:
+                self.cancel(app_id)
+                return pixmap
+
+        task = self.pending.get(app_id)
+        if task is not None:
+            if task.request == request:
+                return self.LOADING
+            self.cancel(app_id)
+        task = IconTask(app_id, request, self.thumbnails, self.signals)
+        self.pending[app_id] = task
+        self.pool.start(task)
+        return self.LOADING
+
+    def cancel(self, app_id):
+        task = self.pending.pop(app_id, None)
+        if task is not None:
+            self.pool.tryTake(task)  # no-op if it is already decoding
+
+    def save_thumbnails(self):
+        self.save_timer.stop()
+        self.save_pool.start(self.thumbnails.save)
+
+    def flush(self):
+        """Write new thumbnails now and wait until they are on disk."""
+        if self.thumbnails.dirty:
+            self.save_thumbnails()
+        self.save_pool.waitForDone()
+
+    def forget(self, app_id=None):
+        """Resolve the app's icon file again on its next request (every app's if None)."""
+        if app_id is None:
+            self.keys.clear()
+        else:
+            self.keys.pop(app_id, None)
+
+    def retain(self, app_ids):
+        """Cancel every pending load whose app id is not in ``app_ids``."""
+        for app_id in [i for i in self.pending if i not in app_ids]:
+            self.cancel(app_id)
+
+    def _on_decoded(self, task, image):
+        if self.thumbnails.dirty:
+            self.save_timer.start()
+        pixmap = QPixmap.fromImage(image) if image is not None else None
+        if task.key is not None:
+            self.cache.put(task.key, pixmap)
+        if self.pending.get(task.app_id) is not task:
+            return  # cancelled or superseded
+        del self.pending[task.app_id]
+        self.keys[task.app_id] = (task.request, task.key)
+        self.icon_ready.emit(task.app_id, pixmap)
+
+
+# ---------------- App Catalog ----------------
+
+class AppRecord:
+    """One app, in slots instead of a dict.
+
+    Reads and writes like the dict it is stored as (``app["name"]``,
+    ``app.get("category", "General")``); keys that are not fields live in
+    ``extra`` and unset fields are None, so to_dict() round-trips the JSON.
+    Change records through AppCatalog.update so its indexes stay right.
+    """
+
+    FIELDS = ("id", "name", "path", "category", "icon_path", "favorite")
+    FIELD_SET = frozenset(FIELDS)
+    __slots__ = FIELDS + ("extra",)
+
+    def __init__(self, id=None, name=None, path=None, category=None, icon_path=None,
+                 favorite=None, extra=None):
+        self.id = id
+        self.name = name
+        self.path = path
+        self.category = category
+        self.icon_path = icon_path
+        self.favorite = favorite
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AppRecord":
+        get = data.get
+        extra = None if data.keys() <= cls.FIELD_SET else {
+            k: v for k, v in data.items() if k not in cls.FIELD_SET}
+        return cls(get("id"), get("name"), get("path"), get("category"),
+                   get("icon_path"), get("favorite"), extra)
+
+    def to_row(self) -> tuple:
+        """Field values in __slots__ order, for AppRecord(*row)."""
+        return (self.id, self.name, self.path, self.category, self.icon_path, self.favorite, self.extra)
+
+    def to_dict(self) -> dict:
+        data = {k: getattr(self, k) for k in self.FIELDS if getattr(self, k) is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, key, default=None):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+        elif self.extra:
+            value = self.extra.get(key)
+        else:
+            value = None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __repr__(self):
+        return f"AppRecord({self.to_dict()!r})"
+
+
+class AppCatalog:
+    """All apps in catalog order, indexed by id, category and favorite flag.
+
+    ``version`` increases with every change so derived views can tell when
+    they are stale.
+    """
+
+    def __init__(self, apps=()):
+        self.records: dict[int, AppRecord] = {}
+        self.by_category: dict[str, set[int]] = {}
+        self.favorites: set[int] = set()
+        self.version = 0
+        self.next_id = 1
+        for app in apps:
+            if isinstance(app, (dict, AppRecord)):
+                self.add(app)
+
+    @classmethod
+    def from_rows(cls, rows) -> "AppCatalog":
+        return cls(AppRecord(*row) for row in rows)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records.values())
+
+    def __contains__(self, app_id):
+        return app_id in self.records
+
+    def get(self, app_id) -> AppRecord | None:
+        return self.records.get(app_id)
+
+    @staticmethod
+    def category_of(record: AppRecord) -> str:
+        return record.get("category", "General")
+
+    def add(self, app) -> AppRecord:
+        """Insert a dict or record; a missing or taken id is replaced with next_id."""
+        record = app if isinstance(app, AppRecord) else AppRecord.from_dict(app)
+        if not isinstance(record.id, int) or record.id in self.records:
+            record.id = self.next_id  # old list-format entries may lack ids
+        self.records[record.id] = record
+        self.next_id = max(self.next_id, record.id + 1)
+        self._index(record)
+        self.version += 1
+        return record
+
+    def update(self, app_id, **fields) -> AppRecord:
+        record = self.records[app_id]
+        self._unindex(record)
+        for key, value in fields.items():
+            record[key] = value
+        self._index(record)
+        self.version += 1
+        return record
+
+    def remove(self, app_id) -> AppRecord | None:
+        record = self.records.pop(app_id, None)
+        if record is not None:
+            self._unindex(record)
+            self.version += 1
+        return record
+
+    def categories(self) -> list[str]:
+        return sorted(self.by_category)
+
+    def to_list(self) -> list[dict]:
+        return [record.to_dict() for record in self.records.values()]
+
+    def to_rows(self) -> list[tuple]:
+        return [record.to_row() for record in self.records.values()]
+
+    def _index(self, record: AppRecord):
+        self.by_category.setdefault(self.category_of(record), set()).add(record.id)
+        if record.favorite:
+            self.favorites.add(record.id)
+
+    def _unindex(self, record: AppRecord):
+        category = self.category_of(record)
+        ids = self.by_category.get(category)
+        if ids is not None:
+            ids.discard(record.id)
+            if not ids:
+                del self.by_category[category]
+        self.favorites.discard(record.id)
+
+
+# ---------------- Search Index ----------------
+
+class SearchIndex:
+    """Normalized search text per app plus a character posting index.
+
+    An app matches a query when the query is a subsequence of its
+    "name category" text, so only apps containing every query character
+    (the intersection of the postings) are ever scored. The search pool
+    reads it under SearchSession.lock, so change it only while holding
+    that lock; ``version`` moves once a change is complete.
+    """
+
+    # Added to the rank of non-favorites so favorites sort first on ties
+    NON_FAVORITE = 1 << 40
+    # Score this many candidates in one NumPy batch instead of one by one
+    BATCH_MIN_CANDIDATES = 20000
+
+    def __init__(self, apps=()):
+        self.texts: dict[int, str] = {}
+        self.apps: dict[int, AppRecord] = {}
+        self.rank: dict[int, int] = {}
+        self.favorites: set[int] = set()
+        self.postings: dict[str, set[int]] = {}
+        self.version = 0
+        self._next_order = 0
+        self._batch = None
+        for app in apps:
+            self.add(app)
+
+    @classmethod
+    def from_state(cls, apps, state: dict) -> "SearchIndex":
+        """Rebuild an index from ``state()`` without normalizing any text."""
+        index = cls()
+        index.texts = dict(state["texts"])
+        index.postings = {ch: set(ids) for ch, ids in state["postings"].items()}
+        for app in apps:
+            app_id = app["id"]
+            index.apps[app_id] = app
+            index.rank[app_id] = index._next_order
+            index._next_order += 1
+            index._set_favorite(app_id, bool(app.get("favorite")))
+        index.version = len(apps)
+        return index
+
+    def state(self) -> dict:
+        """Texts and postings as plain JSON-able data."""
+        return {"texts": list(self.texts.items()), "postings": {ch: list(ids) for ch, ids in self.postings.items()}}
+
+    @staticmethod
+    def search_text(app: dict) -> str:
+        return normalize_text(f"{app.get('name','')} {app.get('category','')}")
+
+    def add(self, app: dict):
+        app_id = app["id"]
+        text = self.search_text(app)
+        self.texts[app_id] = text
+        self.apps[app_id] = app
+        self.rank[app_id] = self._next_order
+        self._next_order += 1
+        self._set_favorite(app_id, bool(app.get("favorite")))
+        for ch in set(text):
+            self.postings.setdefault(ch, set()).add(app_id)
+        self.version += 1
+        self._batch = None
+
+    def update(self, app: dict):
+        app_id = app["id"]
+        if app_id not in self.texts:
+            self.add(app)
+            return
+        self.apps[app_id] = app
+        self._set_favorite(app_id, bool(app.get("favorite")))
+        old = self.texts[app_id]
+        text = self.search_text(app)
+        if old == text:
+            self.version += 1
+            return
+        old_chars = set(old)
+        new_chars = set(text)
+        for ch in old_chars - new_chars:
+            self._discard_posting(ch, app_id)
+        for ch in new_chars - old_chars:
+            self.postings.setdefault(ch, set()).add(app_id)
+        self.texts[app_id] = text
+        self._batch = None
+        self.version += 1
+
+    def remove(self, app_id: int):
+        text = self.texts.pop(app_id, None)
+        if text is None:
+            return
+        self._batch = None
+        self.apps.pop(app_id, None)
+        self.rank.pop(app_id, None)
+        self.favorites.discard(app_id)
+        for ch in set(text):
+            self._discard_posting(ch, app_id)
+        self.version += 1
+
+    def _set_favorite(self, app_id: int, favorite: bool):
+        order = self.rank[app_id] % self.NON_FAVORITE
+        if favorite:
+            self.favorites.add(app_id)
+            self.rank[app_id] = order
+        else:
+            self.favorites.discard(app_id)
+            self.rank[app_id] = order + self.NON_FAVORITE
+
+    def _discard_posting(self, ch: str, app_id: int):
+        ids = self.postings.get(ch)
+        if ids is not None:
+            ids.discard(app_id)
+            if not ids:
+                del self.postings[ch]
+
+    def candidates(self, query: str, within: set[int] | None = None) -> set[int]:
+        """Ids whose text contains every character of the normalized ``query``.
+
+        ``within`` restricts the result to a known superset, such as the
+        matches of a shorter query.
+        """
+        sets = [self.postings.get(ch, set()) for ch in set(query)]
+        if within is not None:
+            sets.append(within)
+        if not sets:
+            return set(self.texts)
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def search(self, query: str, candidates=None) -> dict[int, list[int]]:
+        """Group the apps matching ``query`` by score, as ``{score: [app_id, ...]}``.
+
+        Scores equal fuzzy_score on the app's "name category" text. For a
+        subsequence match that only depends on whether the query is also a
+        substring, so there are at most two buckets.
+        """
+        q = normalize_text(query)
+        if not q:
+            return {}
+        if candidates is None:
+            candidates = self.candidates(q)
+        if np is not None and len(candidates) >= self.BATCH_MIN_CANDIDATES:
+            return self.batch_scorer().buckets(q, candidates)
+        texts = self.texts
+        exact = [app_id for app_id in candidates if q in texts[app_id]]
+        fuzzy = [app_id for app_id in candidates.difference(exact) if is_subsequence(q, texts[app_id])]
+
+        matched = 5 * len(q) + 30 + min(len(q), 10)
+        buckets = {}
+        if exact:
+            buckets[matched + 100] = exact
+        if fuzzy:
+            buckets[matched] = fuzzy
+        return buckets
+
+    def batch_scorer(self) -> "BatchScorer":
+        """NumPy scorer over the current texts, rebuilt after any text change.
+
+        A scorer built while the texts changed is used for that one search
+        but not kept, so it cannot outlive the change.
+        """
+        batch = self._batch
+        if batch is None:
+            version = self.version
+            ids = list(self.texts)
+            batch = BatchScorer(ids, [self.texts[app_id] for app_id in ids])
+            if self.version == version:
+                self._batch = batch
+        return batch
+
+    def ranked(self, buckets: dict[int, list[int]], favorites_only: bool = False,
+               k: int = 0) -> "RankedResults":
+        """Rank ``search`` buckets, materializing only the first ``k`` ids."""
+        if favorites_only:
+            buckets = {score: self.favorites.intersection(ids) for score, ids in buckets.items()}
+        return RankedResults(buckets, self.rank, k)
+
+    def all_ranked(self, favorites_only: bool = False, k: int = 0,
+                   within: set[int] | None = None) -> "RankedResults":
+        """Every id (or every favorite) in favorites-then-catalog order.
+
+        ``within`` limits the result to a subset such as one category; the
+        cost is then proportional to that subset, not to the catalog.
+        """
+        if within is None:
+            ids = self.favorites if favorites_only else self.rank
+        else:
+            ids = within.intersection(self.favorites) if favorites_only else within
+        return RankedResults({0: ids}, self.rank, k)
+
+
+class RankedResults:
+    """Ranked ids where only a prefix is materialized; the rest follows on demand.
+
+    Buckets are visited best score first and ordered inside by SearchIndex
+    rank (favorites, then catalog order). Ranks are unique, so the order is
+    stable however much has been materialized. The first ``k`` ids are
+    picked with a bounded heap; a bucket that is only partly consumed is
+    heapified the first time more of it is asked for. Ids removed from the
+    index after the search (a delete while the results are still shown)
+    are skipped and no longer counted.
+    """
+
+    def __init__(self, buckets: dict, rank: dict[int, int], k: int = 0):
+        self._rank = rank
+        self._pending = [buckets[score] for score in sorted(buckets, reverse=True) if buckets[score]]
+        self._partial = None   # (bucket, rank of the last id taken from it, ids taken)
+        self._heap: list[tuple[int, int]] = []
+        self.total = sum(map(len, self._pending))
+        self.ids: list[int] = []
+        self.materialize(k)
+
+    def __len__(self):
+        return self.total
+
+    def materialize(self, count: int) -> list[int]:
+        """Extend ``ids`` to the first ``count`` results (or all of them) and return it."""
+        rank = self._rank
+        ids = self.ids
+        while len(ids) < count:
+            need = count - len(ids)
+            if self._heap:
+                heap = self._heap
+                for _ in range(min(need, len(heap))):
+                    app_id = heapq.heappop(heap)[1]
+                    if app_id in rank:
+                        ids.append(app_id)
+                    else:
+                        self.total -= 1
+            elif self._partial is not None:
+                bucket, cut, taken = self._partial
+                self._partial = None
+                self._heap = [(rank[i], i) for i in bucket if rank.get(i, cut) > cut]
+                heapq.heapify(self._heap)
+                self.total -= len(bucket) - taken - len(self._heap)
+            elif self._pending:
+                bucket = self._pending[0]
+                try:
+                    if len(bucket) <= need:
+                        top = sorted(bucket, key=rank.__getitem__)
+                    else:
+                        top = heapq.nsmallest(need, bucket, key=rank.__getitem__)
+                except KeyError:
+                    live = [i for i in bucket if i in rank]
+                    self.total -= len(bucket) - len(live)
+                    self._pending[0] = live
+                    continue
+                del self._pending[0]
+                ids.extend(top)
+                if len(top) < len(bucket):
+                    self._partial = (bucket, rank[top[-1]], len(top))
+            else:
+                break
+        return ids
+
+
+class BatchScorer:
+    """fuzzy_score for every indexed text at once, in vectorized NumPy passes.
+
+    Texts are packed as zero-padded UTF-32 code points, stored column-major
+    so each pass reads one contiguous row of the matrix.
+    """
+
+    def __init__(self, ids: list[int], texts: list[str]):
+        self.ids = np.array(ids, dtype=np.int64)
+        width = max(map(len, texts), default=0)
+        packed = "".join(text.ljust(width, "\0") for text in texts).encode("utf-32-le")
+        codes = np.frombuffer(packed, dtype=np.uint32).reshape(len(texts), width)
+        self.columns = np.ascontiguousarray(codes.T)
+
+    def scores(self, query: str):
+        """Array of fuzzy_score(text, query) for every row; ``query`` must be normalized."""
+        width, n = self.columns.shape
+        q = np.frombuffer(query.encode("utf-32-le"), dtype=np.uint32)
+        m = len(q)
+
+        # Greedy subsequence: walk the columns once, advancing each row's
+        # position in the query when its next character matches. The
+        # sentinel past the end never matches a code point.
+        wanted = np.append(q, np.uint32(0xFFFFFFFF))
+        matched = np.zeros(n, dtype=np.intp)
+        for column in self.columns:
+            matched += column == wanted[matched]
+        full = matched == m
+
+        # A substring is also a full subsequence match, so only those rows
+        # need the sliding-window comparison.
+        if m == 1:
+            substring = full
+        else:
+            substring = np.zeros(n, dtype=bool)
+            rows = np.flatnonzero(full)
+            if len(rows) and m <= width:
+                window = self.columns[:, rows]
+                found = np.zeros(len(rows), dtype=bool)
+                for start in range(width - m + 1):
+                    hit = window[start] == q[0]
+                    for k in range(1, m):
+                        hit &= window[start + k] == q[k]
+                    found |= hit
+                substring[rows] = found
+
+        return 100 * substring + 5 * matched + 30 * full + min(m, 10)
+
+    def buckets(self, query: str, candidates=None) -> dict[int, list[int]]:
+        """Same result as SearchIndex.search, limited to ``candidates`` when given."""
+        scores = self.scores(query)
+        m = len(query)
+        keep = scores >= 5 * m + 30 + min(m, 10)  # full subsequence matches
+        if candidates is not None and len(candidates) < len(self.ids):
+            keep &= np.isin(self.ids, np.fromiter(candidates, dtype=np.int64, count=len(candidates)))
+        kept_scores = scores[keep]
+        kept_ids = self.ids[keep]
+        return {
+            int(score): kept_ids[kept_scores == score].tolist()
+            for score in np.unique(kept_scores)
+        }
+
+
+class SearchSession:
+    """Remembers recent searches against a SearchIndex while the user types.
+
+    Extending the previous query only rescans the previous matches, since
+    every match of "vsc" is also a match of "vs". Recent ranked results are
+    kept in an LRU keyed by (query, favorites only, category) so backspacing
+    is a lookup; the LRU is dropped whenever the index version changes, i.e.
+    on any CRUD.
+
+    A category filter passes the category's ids as ``members``; matching
+    then starts from that set instead of the whole catalog.
+    """
+
+    MAX_ENTRIES = 64
+
+    def __init__(self, index: SearchIndex):
+        self.index = index
+        self.lock = threading.Lock()
+        self.results: OrderedDict = OrderedDict()
+        self._version = index.version
+        self._last_query = ""
+        self._last_category = None
+        self._last_matches: set[int] | None = None
+
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+            self._last_matches = None
+
+    def ranked(self, query: str, favorites_only: bool = False, category: str | None = None,
+               members: frozenset[int] | None = None) -> RankedResults:
+        # Called from the search pool and, for Enter, from the UI thread
+        with self.lock:
+            return self._ranked(normalize_text(query), favorites_only, category, members)
+
+    def _ranked(self, q: str, favorites_only: bool, category: str | None,
+                members: frozenset[int] | None) -> RankedResults:
+        index = self.index
+        if self._version != index.version:
+            self.results.clear()
+            self._last_matches = None
+            self._version = index.version
+
+        key = (q, favorites_only, category)
+        ranked = self.results.get(key)
+        if ranked is not None:
+            self.results.move_to_end(key)
+            return ranked
+
+        if not q:
+            ranked = index.all_ranked(favorites_only, SEARCH_TOP_K, members)
+        else:
+            within = members
+            if (self._last_matches is not None and q.startswith(self._last_query)
+                    and category == self._last_category):
+                within = self._last_matches
+            candidates = index.candidates(q, within)
+            buckets = index.search(q, candidates)
+            ranked = index.ranked(buckets, favorites_only, SEARCH_TOP_K)
+            self._last_query = q
+            self._last_category = category
+            self._last_matches = set().union(*buckets.values())
+
+        self.results[key] = ranked
+        if len(self.results) > self.MAX_ENTRIES:
+            self.results.popitem(last=False)
+        return ranked
+
+
+# Quiet time after the last keystroke before a search is started
+SEARCH_DEBOUNCE_MS = 60
+# Results ranked up front per search; the rest are ranked as the view scrolls
+SEARCH_TOP_K = 256
+
+
+class SearchSignals(QObject):
+    # generation, query, RankedResults
+    finished = pyqtSignal(int, str, object)
+
+
+class SearchTask(QRunnable):
+    """Ranks one query on the search pool and reports back through ``signals``."""
+
+    def __init__(self, generation, session, query, favorites_only, signals, current_generation,
+                 category=None, members=None):
+        super().__init__()
+        self.generation = generation
+        self.session = session
+        self.query = query
+        self.favorites_only = favorites_only
+        self.category = category
+        self.members = members
+        self.signals = signals
+        self.current_generation = current_generation
+
+    def run(self):
+        if self.generation != self.current_generation():
+            return  # superseded while queued
+        ranked = self.session.ranked(self.query, self.favorites_only, self.category, self.members)
+        self.signals.finished.emit(self.generation, self.query, ranked)
+
+
 # ---------------- Card Row Widget (Card Mode) ----------------
 
 # ---------------- App Card Widget (Tile Mode) ----------------
 
 class AppCardWidget(QFrame):
+    """An app tile. Its look comes from the window's style sheet, switched by
+    the ``favorite`` property on the card and ``placeholder`` on the icon."""
+
     def __init__(self, app_data, callbacks, parent=None):
         super().__init__(parent)
         self.app_data = app_data
@@ -175,6 +1418,9 @@ class AppCardWidget(QFrame):
         self.setFrameShadow(QFrame.Shadow.Raised)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setToolTip(f"{app_data.get('category', 'General')}")
+        self.setProperty("favorite", bool(app_data.get("favorite")))
+        self.rendered_state = self.visual_state(app_data)
+        self.icon_loaded = False
         
         # Context Menu
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -205,61 +1451,70 @@ class AppCardWidget(QFrame):
         self.icon_label.setFixedSize(80, 80)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.icon_label.setObjectName("AppIconCard")
-        # Default style for placeholder
-        self.icon_label.setStyleSheet("""
-            QLabel {
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 20px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
         layout.addWidget(self.icon_label, alignment=Qt.AlignmentFlag.AlignCenter)
         self.set_icon_visual()
         
         # Name
-        name_label = QLabel(app_data.get("name", "Unnamed"))
-        name_label.setObjectName("AppNameCard")
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_label.setWordWrap(True)
-        name_label.setStyleSheet("font-size: 14px; font-weight: 600; color: #e4e4e7; margin-top: 4px;")
-        layout.addWidget(name_label)
+        self.name_label = QLabel(app_data.get("name", "Unnamed"))
+        self.name_label.setObjectName("AppNameCard")
+        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.name_label.setWordWrap(True)
+        layout.addWidget(self.name_label)
         
         layout.addStretch()
 
+    @staticmethod
+    def visual_state(app_data) -> tuple:
+        """Everything the card renders, used to detect which parts need patching."""
+        return (
+            app_data.get("name", "Unnamed"),
+            app_data.get("category", "General"),
+            bool(app_data.get("favorite")),
+            app_data.get("icon_path"),
+            app_data.get("path"),
+        )
+
+    def set_app_data(self, app_data):
+        """Point the card at ``app_data`` and patch only what changed since the last render."""
+        self.app_data = app_data
+        state = self.visual_state(app_data)
+        old = self.rendered_state
+        if state == old:
+            return
+        self.rendered_state = state
+        name, category, favorite, icon_path, path = state
+        if name != old[0]:
+            self.name_label.setText(name)
+        if category != old[1]:
+            self.setToolTip(category)
+        if favorite != old[2]:
+            self.fav_btn.setText("★" if favorite else "☆")
+            set_flag(self, "favorite", favorite)
+        if (icon_path, path) != old[3:]:
+            self.set_icon_visual()
+
     def set_icon_visual(self):
-        icon_path = self.app_data.get("icon_path")
-        pixmap = None
-        if icon_path and os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-        else:
-            app_path = self.app_data.get("path")
-            if app_path and os.path.exists(app_path):
-                icon = QIcon(app_path)
-                pixmap = icon.pixmap(128, 128)
-        
-        if pixmap and not pixmap.isNull():
-            self.icon_label.setPixmap(
-                pixmap.scaled(
-                    96, 96,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-            )
+        """Show the icon if it is cached, else a loading box until set_icon_pixmap."""
+        self.icon_loaded = False
+        self.icon_label.clear()
+        if not self.request_icon():
+            set_flag(self.icon_label, "placeholder", False)
+
+    def request_icon(self) -> bool:
+        """Show the icon if it is available now; False while it is loading."""
+        pixmap = self.callbacks["request_icon"](self.app_data)
+        if pixmap is IconLoader.LOADING:
+            return False
+        self.set_icon_pixmap(pixmap)
+        return True
+
+    def set_icon_pixmap(self, pixmap: QPixmap | None):
+        self.icon_loaded = True
+        set_flag(self.icon_label, "placeholder", pixmap is None)
+        if pixmap is not None:
+            self.icon_label.setPixmap(pixmap)
         else:
             self.icon_label.setText("⚡")
-            self.icon_label.setStyleSheet("""
-                QLabel {
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:1,
-                        stop:0 rgba(139, 92, 246, 0.15),
-                        stop:1 rgba(99, 102, 241, 0.15)
-                    );
-                    color: #a78bfa;
-                    border-radius: 24px;
-                    border: 1px solid rgba(139, 92, 246, 0.3);
-                    font-size: 48px;
-                }
-            """)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -270,33 +1525,13 @@ class AppCardWidget(QFrame):
         super().mousePressEvent(event)
 
     def show_context_menu(self, pos):
-        menu = QMenu(self)
-        
-        launch_act = QAction("🚀 Launch", self)
-        launch_act.triggered.connect(self.on_launch)
-        menu.addAction(launch_act)
-        
-        menu.addSeparator()
-        
-        fav_text = "Remove from Favorites" if self.app_data.get("favorite") else "Add to Favorites"
-        fav_act = QAction(f"⭐️ {fav_text}", self)
-        fav_act.triggered.connect(self.on_toggle_fav)
-        menu.addAction(fav_act)
-        
-        edit_act = QAction("✏️ Edit", self)
-        edit_act.triggered.connect(self.on_edit)
-        menu.addAction(edit_act)
-        
-        loc_act = QAction("📂 Open File Location", self)
-        loc_act.triggered.connect(self.on_open_location)
-        menu.addAction(loc_act)
-        
-        menu.addSeparator()
-        
-        del_act = QAction("🗑️ Delete", self)
-        del_act.triggered.connect(self.on_delete)
-        menu.addAction(del_act)
-        
+        menu = build_app_menu(self, self.app_data, {
+            "launch": self.on_launch,
+            "toggle_fav": self.on_toggle_fav,
+            "edit": self.on_edit,
+            "open_location": self.on_open_location,
+            "delete": self.on_delete,
+        })
         menu.exec(self.mapToGlobal(pos))
 
     def on_launch(self):
@@ -313,11 +1548,296 @@ class AppCardWidget(QFrame):
         self.callbacks["delete"](self.app_data["id"])
         
     def on_open_location(self):
-        path = self.app_data.get("path")
-        if path and os.path.exists(path):
-            folder = os.path.dirname(path)
-            open_file_cross_platform(folder)
+        open_app_location(self.app_data)
+
+
+
+# ---------------- App Grid View (Virtualized Tile Mode) ----------------
+
+# Catalogs at least this large are shown in the virtualized grid instead of
+# one AppCardWidget per app.
+VIRTUAL_GRID_THRESHOLD = 200
+TILE_WIDTH = 160
+TILE_HEIGHT = 200
+TILE_SPACING = 24
+# Cards are built down to this many viewports below the visible area
+CARD_MARGIN_VIEWPORTS = 1
+# Time one event-loop turn may spend building cards while scrolling
+CARD_BATCH_MS = 8
+
+
+class AppListModel(QAbstractListModel):
+    """Flat model over the apps currently shown in the grid."""
+
+    PAGE_SIZE = SEARCH_TOP_K
+
+    def __init__(self, icon_loader: IconLoader, parent=None):
+        super().__init__(parent)
+        self.icon_loader = icon_loader
+        self._apps: list[dict] = []
+        self._rows: dict[int, int] = {}
+        self._results: RankedResults | None = None
+        self._resolve = None
+        self._fetched = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._apps)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._apps):
+            return None
+        app = self._apps[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return app.get("name", "Unnamed")
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return app.get("category", "General")
+        return None
+
+    def app_at(self, row: int) -> dict | None:
+        if 0 <= row < len(self._apps):
+            return self._apps[row]
+        return None
+
+    def set_apps(self, apps: list[dict]):
+        self.beginResetModel()
+        self._apps = apps
+        self._rows = {app["id"]: row for row, app in enumerate(apps)}
+        self._results = None
+        self.endResetModel()
+
+    def set_results(self, results: RankedResults, resolve):
+        """Show ``results`` a page at a time; ``resolve`` maps ids to app dicts."""
+        self.beginResetModel()
+        self._results = results
+        self._resolve = resolve
+        ids = results.materialize(self.PAGE_SIZE)[:self.PAGE_SIZE]
+        self._fetched = len(ids)
+        self._apps = resolve(ids)
+        self._rows = {app["id"]: row for row, app in enumerate(self._apps)}
+        self.endResetModel()
+
+    def stop_fetching(self):
+        """Keep the rows shown but page no further, e.g. once the index has changed."""
+        self._results = None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return (not parent.isValid() and self._results is not None
+                and self._fetched < len(self._results))
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        start = self._fetched
+        ids = self._results.materialize(start + self.PAGE_SIZE)[start:start + self.PAGE_SIZE]
+        self._fetched += len(ids)
+        apps = self._resolve(ids)
+        if apps:
+            row = len(self._apps)
+            self.beginInsertRows(QModelIndex(), row, row + len(apps) - 1)
+            for offset, app in enumerate(apps):
+                self._rows[app["id"]] = row + offset
+            self._apps.extend(apps)
+            self.endInsertRows()
+
+    def row_of(self, app_id) -> int | None:
+        return self._rows.get(app_id)
+
+    def pixmap_for(self, app: dict):
+        """The tile's icon, None if it has none, or IconLoader.LOADING.
+
+        Only rows that get painted ask for their icon, so decoding is
+        bounded by what has been on screen.
+        """
+        return self.icon_loader.request(app)
+
+    def icon_changed(self, app_id):
+        row = self._rows.get(app_id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+
+class AppTileDelegate(QStyledItemDelegate):
+    """Paints an app tile that looks like AppCardWidget without any child widgets."""
+
+    def __init__(self, callbacks, parent=None):
+        super().__init__(parent)
+        self.callbacks = callbacks
+        self.flat = False  # solid placeholder fill instead of a gradient
+
+    def sizeHint(self, option, index):
+        return QSize(TILE_WIDTH, TILE_HEIGHT)
+
+    @staticmethod
+    def star_rect(rect: QRect) -> QRect:
+        return QRect(rect.right() - 12 - 28 + 1, rect.top() + 12, 28, 28)
+
+    @staticmethod
+    def icon_rect(rect: QRect) -> QRect:
+        return QRect(rect.left() + (rect.width() - 80) // 2, rect.top() + 48, 80, 80)
 
+    def paint(self, painter, option, index):
+        app = index.model().app_at(index.row())
+        if app is None:
+            return
+        rect = option.rect
+        favorite = bool(app.get("favorite"))
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        # Card
+        if favorite:
+            background, border = "#27272a", "#fbbf24"
+        elif hovered:
+            background, border = "#27272a", "#3f3f46"
+        else:
+            background, border = "#18181b", "#27272a"
+        painter.setPen(QPen(QColor(border), 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 24, 24)
+
+        # Favorite star
+        star = self.star_rect(rect)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(255, 255, 255, 13))
+        painter.drawEllipse(star)
+        font = QFont(option.font)
+        font.setPixelSize(18)
+        painter.setFont(font)
+        painter.setPen(QColor("#fbbf24" if favorite else "#71717a"))
+        painter.drawText(star, Qt.AlignmentFlag.AlignCenter, "★" if favorite else "☆")
+
+        # Icon
+        icon_rect = self.icon_rect(rect)
+        pixmap = index.model().pixmap_for(app)
+        if pixmap is IconLoader.LOADING:
+            painter.setBrush(QColor(255, 255, 255, 13))
+            painter.setPen(QPen(QColor(255, 255, 255, 26), 1))
+            painter.drawRoundedRect(QRectF(icon_rect).adjusted(0.5, 0.5, -0.5, -0.5), 20, 20)
+        elif pixmap:
+            size = pixmap.deviceIndependentSize().toSize().scaled(icon_rect.size(), Qt.AspectRatioMode.KeepAspectRatio)
+            target = QRect(QPoint(0, 0), size)
+            target.moveCenter(icon_rect.center())
+            painter.drawPixmap(target, pixmap)
+        else:
+            if self.flat:
+                painter.setBrush(QColor(139, 92, 246, 38))
+            else:
+                gradient = QLinearGradient(QRectF(icon_rect).topLeft(), QRectF(icon_rect).bottomRight())
+                gradient.setColorAt(0, QColor(139, 92, 246, 38))
+                gradient.setColorAt(1, QColor(99, 102, 241, 38))
+                painter.setBrush(QBrush(gradient))
+            painter.setPen(QPen(QColor(139, 92, 246, 77), 1))
+            painter.drawRoundedRect(QRectF(icon_rect).adjusted(0.5, 0.5, -0.5, -0.5), 24, 24)
+            font.setPixelSize(48)
+            painter.setFont(font)
+            painter.setPen(QColor("#a78bfa"))
+            painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, "⚡")
+
+        # Name
+        font = QFont(option.font)
+        font.setPixelSize(14)
+        font.setWeight(QFont.Weight.DemiBold)
+        painter.setFont(font)
+        painter.setPen(QColor("#e4e4e7"))
+        name_rect = QRect(
+            rect.left() + 12, icon_rect.bottom() + 13,
+            rect.width() - 24, rect.bottom() - icon_rect.bottom() - 28
+        )
+        name = QFontMetrics(font).elidedText(
+            app.get("name", "Unnamed"), Qt.TextElideMode.ElideRight, name_rect.width() * 2
+        )
+        painter.drawText(
+            name_rect,
+            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            name
+        )
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonPress
+                and event.button() == Qt.MouseButton.LeftButton):
+            app = model.app_at(index.row())
+            if app is not None:
+                if self.star_rect(option.rect).contains(event.position().toPoint()):
+                    self.callbacks["toggle_fav"](app["id"])
+                else:
+                    self.callbacks["launch"](app["id"])
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class AppGridView(QListView):
+    """Icon-mode list view that only paints the tiles inside the viewport."""
+
+    def __init__(self, callbacks, parent=None):
+        super().__init__(parent)
+        self.callbacks = callbacks
+
+        self.setObjectName("AppGrid")
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(256)
+        self.setUniformItemSizes(True)
+        self.setGridSize(QSize(TILE_WIDTH + TILE_SPACING, TILE_HEIGHT + TILE_SPACING))
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(24)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setItemDelegate(AppTileDelegate(callbacks, self))
+
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.show_context_menu)
+
+        # Once scrolling settles, stop decoding icons of tiles that left the viewport
+        self.icon_retain_timer = QTimer(self)
+        self.icon_retain_timer.setSingleShot(True)
+        self.icon_retain_timer.setInterval(100)
+        self.icon_retain_timer.timeout.connect(self.retain_visible_icons)
+        self.verticalScrollBar().valueChanged.connect(self.icon_retain_timer.start)
+
+    def set_effects(self, enabled: bool):
+        """Hover highlighting and gradients on, or off for performance mode."""
+        self.setMouseTracking(enabled)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover, enabled)
+        self.itemDelegate().flat = not enabled
+        self.viewport().update()
+
+    def retain_visible_icons(self):
+        model = self.model()
+        loader = model.icon_loader
+        viewport = self.viewport().rect()
+        visible = set()
+        for app_id in loader.pending:
+            row = model.row_of(app_id)
+            if row is not None and self.visualRect(model.index(row)).intersects(viewport):
+                visible.add(app_id)
+        loader.retain(visible)
+
+    def show_context_menu(self, pos):
+        index = self.indexAt(pos)
+        app = self.model().app_at(index.row()) if index.isValid() else None
+        if app is None:
+            return
+        app_id = app["id"]
+        menu = build_app_menu(self, app, {
+            "launch": lambda: self.callbacks["launch"](app_id),
+            "toggle_fav": lambda: self.callbacks["toggle_fav"](app_id),
+            "edit": lambda: self.callbacks["edit"](app_id),
+            "open_location": lambda: open_app_location(app),
+            "delete": lambda: self.callbacks["delete"](app_id),
+        })
+        menu.exec(self.viewport().mapToGlobal(pos))
 
 
 class EditAppDialog(QDialog):
@@ -468,6 +1988,11 @@ class SettingsDialog(QDialog):
         self.start_min_toggle.setChecked(settings.get("start_minimized", False))
         layout.addLayout(self.create_option_row("Start Minimized", "Launch application silently in the tray", self.start_min_toggle))
 
+        # Performance Mode
+        self.performance_toggle = Toggle()
+        self.performance_toggle.setChecked(settings.get("performance_mode", False))
+        layout.addLayout(self.create_option_row("Performance Mode", "No animations, gradients or hover effects", self.performance_toggle))
+
         layout.addStretch()
 
         # Buttons
@@ -547,14 +2072,473 @@ class SettingsDialog(QDialog):
 
     def save_and_accept(self):
         self.result_settings = {
+            **self.settings,
             "minimize_to_tray": self.min_tray_toggle.isChecked(),
-            "start_minimized": self.start_min_toggle.isChecked()
+            "start_minimized": self.start_min_toggle.isChecked(),
+            "performance_mode": self.performance_toggle.isChecked()
         }
         self.accept()
 
 
+# ---------------- Persistence ----------------
+
+# Changes arriving within this window share one write
+SAVE_DELAY_MS = 400
+
+# "journal" storage: apps.json is a compact base snapshot and per-app
+# changes are appended to JOURNAL_FILE until it outgrows this
+JOURNAL_FILE = "apps.journal"
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+# "sqlite" storage: the catalog lives in DB_FILE and is updated row by row
+DB_FILE = "apps.db"
+
+
+# Derived copy of the loaded config; see read_snapshot
+SNAPSHOT_FILE = "apps.snapshot"
+SNAPSHOT_MAGIC = b"LSNAP3\n"
+
+
+def source_stamp() -> tuple:
+    """(mtime_ns, size) of the config and its journal, None for a missing file."""
+    stamp = []
+    for path in (CONFIG_FILE, JOURNAL_FILE):
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def read_snapshot() -> dict | None:
+    """The startup snapshot, if it was written for the config files as they are now.
+
+    It holds the parsed catalog, next_id and the SearchIndex state, so a
+    valid one replaces journal replay and index building. Layout: MAGIC,
+    little-endian uint32 payload length and CRC-32, then compact JSON; the
+    payload is only decoded once its length and checksum match.
+    """
+    try:
+        with open(SNAPSHOT_FILE, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None
+    start = len(SNAPSHOT_MAGIC) + 8
+    if len(raw) < start or raw[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        return None
+    length = int.from_bytes(raw[start - 8:start - 4], "little")
+    crc = int.from_bytes(raw[start - 4:start], "little")
+    payload = memoryview(raw)[start:]
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        return None
+    try:
+        snapshot = json.loads(payload.tobytes())
+        snapshot["stamp"] = tuple(tuple(s) if s else None for s in snapshot["stamp"])
+    except (ValueError, TypeError, KeyError):
+        return None
+    if snapshot["stamp"] != source_stamp():
+        return None
+    return snapshot
+
+
+def write_snapshot(snapshot: dict):
+    snapshot = {**snapshot, "stamp": source_stamp()}
+    tmp_path = f"{SNAPSHOT_FILE}.tmp"
+    try:
+        payload = json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(len(payload).to_bytes(4, "little"))
+            f.write(zlib.crc32(payload).to_bytes(4, "little"))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, SNAPSHOT_FILE)
+    except (OSError, TypeError, ValueError):  # TypeError: a value JSON cannot store
+        pass  # only a cache: the next start reads the JSON
+
+
+def write_json_atomic(path: str, data, indent: int | None = 2):
+    """Replace ``path`` with ``data``; a crash leaves the old or the new file, never half of one."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        if indent is None:
+            json.dump(data, f, separators=(",", ":"))
+        else:
+            json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_journal(path: str) -> tuple[list[dict], int]:
+    """Parse journal records and return them with the size of the intact prefix.
+
+    A record counts only once its newline is on disk, so a write torn by a
+    crash ends the journal instead of failing the load.
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return [], 0
+    records, valid = [], 0
+    for line in raw.split(b"\n")[:-1]:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            break
+        if not isinstance(record, dict):
+            break
+        records.append(record)
+        valid += len(line) + 1
+    return records, valid
+
+
+def replay_journal(apps: list[dict], records: list[dict]) -> list[dict]:
+    """Apply journal records on top of a snapshot, keeping catalog order.
+
+    Every record sets a final value, so replaying records the snapshot
+    already contains (after an interrupted compaction) changes nothing.
+    """
+    if not records:
+        return apps
+    by_id = {app.get("id"): app for app in apps}
+    for record in records:
+        op = record.get("op")
+        if op in ("add", "edit"):
+            app = record.get("app")
+            if isinstance(app, dict):
+                by_id[app.get("id")] = app
+        elif op == "favorite":
+            app = by_id.get(record.get("id"))
+            if app is not None:
+                app["favorite"] = bool(record.get("value"))
+        elif op == "delete":
+            by_id.pop(record.get("id"), None)
+    return list(by_id.values())
+
+
+class AppStore:
+    """SQLite catalog: one row per app, with settings in a key/value table.
+
+    id, category and favorite are indexed columns. Lookups stay in memory:
+    queries go through SearchIndex and category/favorites-only filters
+    through AppCatalog.by_category and .favorites, so the store only loads
+    and persists the catalog.
+    Keys this schema does not know survive in the ``extra`` JSON column,
+    and missing ones are stored as NULL.
+    Every call opens its own connection, so the store can be used from
+    the writer thread and the UI thread alike.
+    """
+
+    COLUMNS = ("id", "name", "path", "category", "icon_path", "favorite")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS apps (
+            id INTEGER PRIMARY KEY,
+            position INTEGER NOT NULL,
+            name TEXT,
+            path TEXT,
+            category TEXT,
+            icon_path TEXT,
+            favorite INTEGER NOT NULL DEFAULT 0,
+            extra TEXT
+        );
+        CREATE INDEX IF NOT EXISTS apps_position ON apps(position);
+        CREATE INDEX IF NOT EXISTS apps_category ON apps(category);
+        CREATE INDEX IF NOT EXISTS apps_favorite ON apps(favorite);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+    """
+
+    def __init__(self, path: str = DB_FILE):
+        self.path = path
+        self._ready = False
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        if not self._ready:
+            conn.executescript(self.SCHEMA)
+            self._ready = True
+        return conn
+
+    @classmethod
+    def row(cls, app: dict) -> tuple:
+        extra = {k: v for k, v in app.items() if k not in cls.COLUMNS}
+        return (
+            app["id"], app.get("name"), app.get("path"), app.get("category"),
+            app.get("icon_path"), int(bool(app.get("favorite"))),
+            json.dumps(extra) if extra else None
+        )
+
+    def load(self) -> tuple[list[dict], bool, dict]:
+        """Return (apps in catalog order, first_run, settings)."""
+        with closing(self.connect()) as conn:
+            apps = []
+            for *values, extra in conn.execute(
+                    "SELECT id, name, path, category, icon_path, favorite, extra FROM apps ORDER BY position"):
+                # NULL columns were keys the app never had
+                app = {k: v for k, v in zip(self.COLUMNS, values) if v is not None}
+                app["favorite"] = bool(app["favorite"])
+                if extra:
+                    app.update(json.loads(extra))
+                apps.append(app)
+            meta = {key: json.loads(value) for key, value in conn.execute("SELECT key, value FROM meta")}
+        return apps, meta.get("first_run", True), meta.get("settings", {"minimize_to_tray": True, "start_minimized": False})
+
+    def replace_all(self, data: dict):
+        """Store a whole config snapshot, as used by migration and full saves."""
+        with closing(self.connect()) as conn, conn:
+            conn.execute("DELETE FROM apps")
+            conn.executemany(
+                "INSERT INTO apps (position, id, name, path, category, icon_path, favorite, extra)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((position, *self.row(app)) for position, app in enumerate(data["apps"]))
+            )
+            self._put_meta(conn, data)
+
+    def apply(self, records: list[dict]):
+        """Apply journal-style change records in one transaction."""
+        with closing(self.connect()) as conn, conn:
+            for record in records:
+                op = record.get("op")
+                if op in ("add", "edit"):
+                    conn.execute(
+                        "INSERT INTO apps (position, id, name, path, category, icon_path, favorite, extra)"
+                        " VALUES ((SELECT COALESCE(MAX(position), -1) + 1 FROM apps), ?, ?, ?, ?, ?, ?, ?)"
+                        " ON CONFLICT(id) DO UPDATE SET name = excluded.name, path = excluded.path,"
+                        " category = excluded.category, icon_path = excluded.icon_path,"
+                        " favorite = excluded.favorite, extra = excluded.extra",
+                        self.row(record["app"])
+                    )
+                elif op == "favorite":
+                    conn.execute("UPDATE apps SET favorite = ? WHERE id = ?",
+                                 (int(bool(record.get("value"))), record.get("id")))
+                elif op == "delete":
+                    conn.execute("DELETE FROM apps WHERE id = ?", (record.get("id"),))
+
+    @staticmethod
+    def _put_meta(conn, data: dict):
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("first_run", json.dumps(data["first_run"])), ("settings", json.dumps(data["settings"]))]
+        )
+
+
+class SaveSignals(QObject):
+    failed = pyqtSignal(str)
+
+
+class SaveTask(QRunnable):
+    """Writes one snapshot, or appends journal lines, on the writer thread."""
+
+    def __init__(self, path, signals, data=None, journal_text="", compact=False, store=None, records=()):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+        self.data = data
+        self.journal_text = journal_text
+        self.compact = compact
+        self.store = store
+        self.records = records
+
+    def run(self):
+        try:
+            if self.store is not None:
+                if self.data is not None:
+                    self.store.replace_all(self.data)  # also covers switching to sqlite at runtime
+                else:
+                    self.store.apply(self.records)
+            elif self.data is not None:
+                write_json_atomic(self.path, self.data, None if self.compact else 2)
+                # the snapshot now holds everything the journal (or database) did
+                for stale in (JOURNAL_FILE, DB_FILE):
+                    if os.path.exists(stale):
+                        os.remove(stale)
+            else:
+                with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+                    f.write(self.journal_text)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except (OSError, TypeError, ValueError, sqlite3.Error) as e:
+            self.signals.failed.emit(str(e))
+
+
+class ConfigWriter(QObject):
+    """Coalesces save requests into one write off the UI thread.
+
+    schedule() only marks the config dirty; the snapshot is taken when the
+    delay expires, so a burst of changes costs a single write. In journal
+    mode, per-app changes are appended to JOURNAL_FILE instead of rewriting
+    the catalog, and folded into a new snapshot once it grows too large. In
+    sqlite mode they are applied to the AppStore rows in one transaction.
+    """
+
+    failed = pyqtSignal(str)
+
+    def __init__(self, path: str, snapshot, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.snapshot = snapshot
+        self.storage = "json"  # or "journal" / "sqlite", from the "storage" setting
+        self.store = AppStore()
+        self.journal_bytes = 0
+        self.records: list[dict] = []
+        self.full = False
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)  # writes land on disk in order
+        self.signals = SaveSignals(self)
+        self.signals.failed.connect(self.failed)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(SAVE_DELAY_MS)
+        self.timer.timeout.connect(self.write)
+
+    @property
+    def dirty(self) -> bool:
+        return self.timer.isActive()
+
+    def schedule(self, change: dict | None = None):
+        """Mark the config dirty; ``change`` is the journal record, if any.
+
+        Without a record (settings, first-run flag) the next write is a
+        full snapshot.
+        """
+        if change is None:
+            self.full = True
+        else:
+            self.records.append(change)
+        # not restarted, so a steady stream of changes still saves every SAVE_DELAY_MS
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def write(self):
+        self.timer.stop()
+        records, full = self.records, self.full
+        self.records, self.full = [], False
+        if self.storage == "sqlite":
+            data = self.snapshot() if full else None
+            self.pool.start(SaveTask(self.path, self.signals, data=data, store=self.store, records=records))
+            return
+
+        journal = self.storage == "journal"
+        journal_text = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        if (journal and not full and os.path.exists(self.path)
+                and self.journal_bytes + len(journal_text) <= JOURNAL_COMPACT_BYTES):
+            self.journal_bytes += len(journal_text)
+            task = SaveTask(self.path, self.signals, journal_text=journal_text)
+        else:
+            self.journal_bytes = 0
+            task = SaveTask(self.path, self.signals, data=self.snapshot(), compact=journal)
+        self.pool.start(task)
+
+    def flush(self):
+        """Write pending changes now and wait until they are on disk."""
+        if self.dirty:
+            self.write()
+        self.pool.waitForDone()
+
+
+# ---------------- App Launching ----------------
+
+# Launches that may be spawning at once, e.g. while a slow mount answers
+LAUNCH_THREADS = 4
+
+
+class LaunchSignals(QObject):
+    launched = pyqtSignal(int, float)  # app id, seconds to spawn
+    failed = pyqtSignal(int, str)      # app id, error message
+
+
+class LaunchTask(QRunnable):
+    """Checks and spawns one app on the launch pool."""
+
+    def __init__(self, app_id, path, signals):
+        super().__init__()
+        self.app_id = app_id
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            open_file_cross_platform(self.path)
+        except Exception as e:
+            self.signals.failed.emit(self.app_id, str(e))
+            return
+        self.signals.launched.emit(self.app_id, time.perf_counter() - start)
+
+
+class LaunchExecutor(QObject):
+    """Runs app launches off the UI thread and keeps spawn latency per app.
+
+    Launches of different apps run concurrently; launching an app that is
+    still spawning is ignored, so repeated clicks on a slow mount start it
+    once.
+    """
+
+    launched = pyqtSignal(int, float)  # app id, seconds to spawn
+    failed = pyqtSignal(int, str)      # app id, error message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(LAUNCH_THREADS)
+        self.pending: set[int] = set()
+        self.latency: dict[int, tuple[int, float, float]] = {}  # id -> (launches, total, last) seconds
+        self.signals = LaunchSignals(self)
+        self.signals.launched.connect(self._on_launched)
+        self.signals.failed.connect(self._on_failed)
+
+    def launch(self, app_id: int, path: str) -> bool:
+        """Start launching ``path``; False if this app is already being launched."""
+        if app_id in self.pending:
+            return False
+        self.pending.add(app_id)
+        self.pool.start(LaunchTask(app_id, path, self.signals))
+        return True
+
+    def _on_launched(self, app_id, seconds):
+        self.pending.discard(app_id)
+        launches, total, _ = self.latency.get(app_id, (0, 0.0, 0.0))
+        self.latency[app_id] = (launches + 1, total + seconds, seconds)
+        self.launched.emit(app_id, seconds)
+
+    def _on_failed(self, app_id, error):
+        self.pending.discard(app_id)
+        self.failed.emit(app_id, error)
+
+    def stats(self, app_id: int) -> dict:
+        launches, total, last = self.latency.get(app_id, (0, 0.0, 0.0))
+        return {"launches": launches, "mean_s": total / launches if launches else 0.0, "last_s": last}
+
+
 # ---------------- Main Window ----------------
 
+# The "performance_mode" setting drops every :hover rule from the window
+# style sheet, so the pointer never restyles or repaints a widget, and
+# appends flat fills for the gradients
+HOVER_RULE = re.compile(r"^[^{}]*:hover[^{}]*\{[^{}]*\}", re.MULTILINE)
+PERFORMANCE_STYLES = """
+    #MainArea {
+        background: #09090b;
+    }
+    #AppIconCard[placeholder="true"] {
+        background: rgba(139, 92, 246, 0.15);
+    }
+"""
+# Seconds hidden in the tray before cards and pixmaps are released; the
+# "hidden_release_s" setting overrides it and 0 keeps them
+HIDDEN_RELEASE_S = 300
+# Apps listed in each tray menu section
+TRAY_FAVORITES = 10
+TRAY_RECENT = 5
+# Launched apps remembered for the tray's recent section
+TRAY_RECENT_HISTORY = 50
+
+
 class AppLauncher(QWidget):
     def __init__(self):
         super().__init__()
@@ -565,8 +2549,7 @@ class AppLauncher(QWidget):
         default_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
         self.setWindowIcon(default_icon)
 
-        self.apps: list[dict] = []
-        self.next_id: int = 1
+        self.catalog = AppCatalog()
         self.filtered_apps: list[dict] = []
         self.first_run: bool = True
         self.settings: dict = {
@@ -575,15 +2558,73 @@ class AppLauncher(QWidget):
         }
 
         self.favorite_mode = 0       # 0 = normal, 1 = favs first, 2 = favs only
-
-        # tray
+        self.category_filter: str | None = None
+        self.search_index = SearchIndex()
+        self.search_session = SearchSession(self.search_index)
+
+        # search pipeline: keystrokes are debounced, then ranked on a single
+        # worker; only the newest generation is published
+        self.search_generation = 0
+        self.published_generation = 0
+        self.search_pool = QThreadPool(self)
+        self.search_pool.setMaxThreadCount(1)
+        self.search_signals = SearchSignals(self)
+        self.search_signals.finished.connect(self.on_search_finished)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.refresh_view)
+
+        # while hidden the view is not rebuilt; showing it again catches up once
+        self.view_stale = False
+        self.release_timer = QTimer(self)
+        self.release_timer.setSingleShot(True)
+        self.release_timer.timeout.connect(self.release_view)
+
+        self.icon_loader = IconLoader(self)
+        self.icon_loader.icon_ready.connect(self.on_icon_ready)
+        QApplication.instance().aboutToQuit.connect(self.icon_loader.flush)
+
+        self.config_writer = ConfigWriter(CONFIG_FILE, self.config_snapshot, self)
+        self.config_writer.failed.connect(lambda error: self.show_toast(f"Could not save: {error}", 4000))
+        QApplication.instance().aboutToQuit.connect(self.config_writer.flush)
+        QApplication.instance().aboutToQuit.connect(self.save_startup_snapshot)  # after the flush
+        self.snapshot_stamp = None
+
+        self.launch_executor = LaunchExecutor(self)
+        self.launch_executor.launched.connect(self.on_app_launched)
+        self.launch_executor.failed.connect(self.on_launch_failed)
+
+        self.card_callbacks = {
+            "launch": self.launch_app,
+            "toggle_fav": self.toggle_favorite,
+            "edit": self.edit_app,
+            "delete": self.delete_app,
+            "request_icon": self.icon_loader.request
+        }
+        self.card_pool: dict[int, AppCardWidget] = {}
+        self.shown_card_ids: set[int] = set()
+        # results laid out as cards; only card_apps[:card_limit] have widgets yet
+        self.card_apps: list[dict] = []
+        self.card_limit = 0
+        self.card_fill_timer = QTimer(self)
+        self.card_fill_timer.setSingleShot(True)
+        self.card_fill_timer.timeout.connect(self.fill_cards)
+
+        # tray: the menu is rebuilt on aboutToShow, and only when marked dirty
         self.tray_icon: QSystemTrayIcon | None = None
         self.tray_menu: QMenu | None = None
+        self.tray_dirty = True
+        self.tray_actions: dict[int, QAction] = {}
+        self.recent_launches: OrderedDict[int, int] = OrderedDict()  # id -> launches, least recent first
 
         Path(ICON_DIR).mkdir(exist_ok=True)
         self.load_config()
+        self.icon_loader.cache.set_budget(int(self.settings.get("icon_cache_mb", ICON_CACHE_MB)) * 1024 * 1024)
+        self.icon_loader.dpr = self.devicePixelRatioF()
         self.build_ui()
         self.apply_styles()
+        self.apply_performance_mode()
         self.setup_shortcuts()
         self.refresh_view()
         self.init_tray_icon()
@@ -591,45 +2632,137 @@ class AppLauncher(QWidget):
     # ------- Config -------
 
     def load_config(self):
+        self.first_run = True
+        self.settings = {"minimize_to_tray": True, "start_minimized": False}
+        apps = []
+        if os.path.exists(DB_FILE):
+            try:
+                apps, self.first_run, self.settings = self.config_writer.store.load()
+            except (sqlite3.Error, ValueError) as e:
+                self.recover_from_store(e)
+            else:
+                self.finish_loading(apps)
+                return
+
+        snapshot = read_snapshot()
+        if snapshot is not None:
+            self.first_run = snapshot["first_run"]
+            self.settings = snapshot["settings"]
+            self.snapshot_stamp = snapshot["stamp"]
+            self.config_writer.journal_bytes = snapshot["stamp"][1][1] if snapshot["stamp"][1] else 0
+            self.finish_loading(AppCatalog.from_rows(snapshot["apps"]), snapshot)
+            return
+
         if not os.path.exists(CONFIG_FILE):
-            self.apps = []
-            self.next_id = 1
-            self.first_run = True
-            self.settings = {"minimize_to_tray": True, "start_minimized": False}
+            self.finish_loading(apps)
             return
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
         except Exception:
-            self.apps = []
-            self.next_id = 1
-            self.first_run = True
-            self.settings = {"minimize_to_tray": True, "start_minimized": False}
+            self.finish_loading(apps)
             return
             
         if isinstance(data, dict):
-            self.apps = data.get("apps", [])
+            apps = data.get("apps", [])
             self.first_run = data.get("first_run", True)
             self.settings = data.get("settings", {"minimize_to_tray": True, "start_minimized": False})
-        else:
+        elif isinstance(data, list):
             # Migration from old list format
-            if isinstance(data, list):
-                self.apps = data
-            else:
-                self.apps = []
-            self.first_run = True
-            self.settings = {"minimize_to_tray": True, "start_minimized": False}
+            apps = data
             
-        ids = [app.get("id", 0) for app in self.apps if isinstance(app, dict)]
-        self.next_id = max(ids) + 1 if ids else 1
+        records, valid = read_journal(JOURNAL_FILE)
+        apps = replay_journal(apps, records)
+        self.config_writer.journal_bytes = valid
+        if os.path.exists(JOURNAL_FILE) and os.path.getsize(JOURNAL_FILE) > valid:
+            os.truncate(JOURNAL_FILE, valid)  # drop a torn record before appending after it
+
+        self.finish_loading(apps)
+        if self.settings.get("storage") == "sqlite":
+            self.migrate_to_store()
+
+    def recover_from_store(self, error):
+        """Set a corrupt database aside and fall back to the JSON backup it was migrated from.
+
+        The file is kept as ``apps.db.broken`` so that no later save can
+        overwrite or delete it; with the "sqlite" setting the backup is
+        migrated into a new database. Any other error (a database locked
+        by another instance, a file we may not read) leaves everything in
+        place and closes the launcher, since the backup is older.
+        """
+        message = f"Could not read {DB_FILE}:\n{error}"
+        # OperationalError and friends are subclasses; plain DatabaseError is a damaged file
+        if not (isinstance(error, ValueError) or type(error) is sqlite3.DatabaseError):
+            self.abort_loading(message)
+        broken = DB_FILE + ".broken"
+        try:
+            os.replace(DB_FILE, broken)
+        except OSError as e:
+            self.abort_loading(f"{message}\n\nIt could not be set aside either:\n{e}")
+        self.config_writer.store = AppStore()  # create the schema afresh if migrating again
+        backup = CONFIG_FILE + ".bak"
+        if not os.path.exists(CONFIG_FILE) and os.path.exists(backup):
+            shutil.copy2(backup, CONFIG_FILE)
+            fallback = f"Loaded the last backup, {backup}."
+        else:
+            fallback = f"Loaded {CONFIG_FILE}." if os.path.exists(CONFIG_FILE) else "No backup was found."
+        QMessageBox.warning(
+            self, "Storage",
+            f"{message}\n\nIt was kept as {broken}. {fallback}"
+        )
+
+    def abort_loading(self, message: str):
+        """Report a config that cannot be loaded safely and exit without touching it."""
+        QMessageBox.critical(self, "Storage", f"{message}\n\nNothing was changed. The launcher will close.")
+        raise SystemExit(1)
 
-    def save_config(self):
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump({
-                "apps": self.apps, 
-                "first_run": self.first_run,
-                "settings": self.settings
-            }, f, indent=2)
+    def migrate_to_store(self):
+        """Move the JSON catalog (and its journal) into the SQLite store."""
+        try:
+            self.config_writer.store.replace_all(self.config_snapshot())
+        except sqlite3.Error as e:
+            QMessageBox.warning(self, "Storage", f"Could not create {DB_FILE}, keeping {CONFIG_FILE}:\n{e}")
+            self.settings["storage"] = "json"
+            self.config_writer.storage = "json"
+            return
+        os.replace(CONFIG_FILE, CONFIG_FILE + ".bak")
+        if os.path.exists(JOURNAL_FILE):
+            os.remove(JOURNAL_FILE)
+
+    def finish_loading(self, apps, snapshot: dict | None = None):
+        self.config_writer.storage = self.settings.get("storage", "json")
+        self.catalog = apps if isinstance(apps, AppCatalog) else AppCatalog(apps)
+        if snapshot is not None:
+            self.catalog.next_id = max(self.catalog.next_id, snapshot["next_id"])
+            self.search_index = SearchIndex.from_state(self.catalog, snapshot["index"])
+        else:
+            self.search_index = SearchIndex(self.catalog)
+        self.search_session = SearchSession(self.search_index)
+
+    def save_startup_snapshot(self):
+        """Record the config as it now is on disk for the next start (JSON storage only)."""
+        if self.config_writer.storage == "sqlite" or not os.path.exists(CONFIG_FILE):
+            return
+        if self.snapshot_stamp is not None and self.snapshot_stamp == source_stamp():
+            return  # loaded from a snapshot and nothing was written since
+        write_snapshot({
+            "apps": self.catalog.to_rows(),
+            "first_run": self.first_run,
+            "settings": self.settings,
+            "next_id": self.catalog.next_id,
+            "index": self.search_index.state(),
+        })
+
+    def save_config(self, change: dict | None = None):
+        self.config_writer.schedule(change)
+
+    def config_snapshot(self) -> dict:
+        # shallow copies: the writer thread serializes them while the UI keeps editing
+        return {
+            "apps": self.catalog.to_list(),
+            "first_run": self.first_run,
+            "settings": dict(self.settings)
+        }
 
     # ------- UI -------
 
@@ -667,7 +2800,7 @@ class AppLauncher(QWidget):
         self.search_input.setPlaceholderText("Search apps...")
         self.search_input.setObjectName("SidebarSearch")
         self.search_input.setToolTip("Ctrl+P")
-        self.search_input.textChanged.connect(self.refresh_view)
+        self.search_input.textChanged.connect(self.schedule_search)
         self.search_input.returnPressed.connect(self.launch_top_match)
         sidebar_layout.addWidget(self.search_input)
         
@@ -680,6 +2813,16 @@ class AppLauncher(QWidget):
         self.category_buttons_layout = QVBoxLayout()
         self.category_buttons_layout.setSpacing(4)
         sidebar_layout.addLayout(self.category_buttons_layout)
+
+        self.all_btn = self.sidebar_button(QStyle.StandardPixmap.SP_DirHomeIcon)
+        self.all_btn.clicked.connect(self.show_all_apps)
+        self.category_buttons_layout.addWidget(self.all_btn)
+        self.fav_btn = self.sidebar_button(QStyle.StandardPixmap.SP_DialogYesButton)
+        self.fav_btn.clicked.connect(lambda: self.toggle_favorite_mode())
+        self.category_buttons_layout.addWidget(self.fav_btn)
+        self.category_icon = QIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
+        self.category_buttons: dict[str, QPushButton] = {}
+        self.sidebar_version = -1
         
         sidebar_layout.addSpacing(24)
         
@@ -767,6 +2910,15 @@ class AppLauncher(QWidget):
         self.suggestion_label.setObjectName("SuggestionLabel")
         self.suggestion_label.setVisible(False)
         top_bar.addWidget(self.suggestion_label)
+
+        # Active category filter, click to clear
+        self.filter_chip = QPushButton("")
+        self.filter_chip.setObjectName("FilterChip")
+        self.filter_chip.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.filter_chip.setToolTip("Clear category filter")
+        self.filter_chip.setVisible(False)
+        self.filter_chip.clicked.connect(lambda: self.set_category_filter(None))
+        top_bar.addWidget(self.filter_chip)
         
         main_layout.addLayout(top_bar)
         
@@ -794,6 +2946,16 @@ class AppLauncher(QWidget):
         
         self.scroll_area.setWidget(self.scroll_content)
         self.content_area.addWidget(self.scroll_area)
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.schedule_card_fill)
+        scroll_bar.rangeChanged.connect(self.schedule_card_fill)
+
+        # Virtualized grid used instead of the card layout for large catalogs
+        self.grid_model = AppListModel(self.icon_loader, self)
+        self.grid_view = AppGridView(self.card_callbacks)
+        self.grid_view.setModel(self.grid_model)
+        self.grid_view.hide()
+        self.content_area.addWidget(self.grid_view)
         
         # Toast notification
         self.toast_label = QLabel()
@@ -812,7 +2974,7 @@ class AppLauncher(QWidget):
             QTimer.singleShot(500, self.show_welcome_message)
 
     def apply_styles(self):
-        self.setStyleSheet("""
+        sheet = """
             QWidget {
                 background: #09090b;
                 color: #e4e4e7;
@@ -912,8 +3074,21 @@ class AppLauncher(QWidget):
                 border: 1px solid rgba(139, 92, 246, 0.2);
                 font-weight: 600;
             }
+
+            #FilterChip {
+                font-size: 13px;
+                color: #ffffff;
+                padding: 8px 16px;
+                background: rgba(139, 92, 246, 0.35);
+                border-radius: 18px;
+                border: 1px solid rgba(139, 92, 246, 0.6);
+                font-weight: 600;
+            }
+            #FilterChip:hover {
+                background: rgba(139, 92, 246, 0.55);
+            }
             
-            #ScrollArea, #ScrollContent {
+            #ScrollArea, #ScrollContent, #AppGrid {
                 background: transparent;
                 border: none;
             }
@@ -929,11 +3104,36 @@ class AppLauncher(QWidget):
                 border: 1px solid #3f3f46;
                 margin-top: -4px; /* Lift effect */
             }
+            #AppCard[favorite="true"] {
+                background: #27272a;
+                border: 1px solid #fbbf24;
+            }
+            #AppCard[favorite="true"]:hover {
+                background: #27272a;
+                border: 1px solid #fbbf24;
+            }
+            
+            #AppIconCard {
+                background: rgba(255, 255, 255, 0.05);
+                border-radius: 20px;
+                border: 1px solid rgba(255, 255, 255, 0.1);
+            }
+            #AppIconCard[placeholder="true"] {
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(139, 92, 246, 0.15),
+                    stop:1 rgba(99, 102, 241, 0.15)
+                );
+                color: #a78bfa;
+                border-radius: 24px;
+                border: 1px solid rgba(139, 92, 246, 0.3);
+                font-size: 48px;
+            }
             
             #AppNameCard {
-                font-size: 16px;
+                font-size: 14px;
                 font-weight: 600;
-                color: #f4f4f5;
+                color: #e4e4e7;
                 margin-top: 4px;
             }
             
@@ -1011,7 +3211,10 @@ class AppLauncher(QWidget):
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
                 height: 0px;
             }
-        """)
+        """
+        if self.settings.get("performance_mode", False):
+            sheet = HOVER_RULE.sub("", sheet) + PERFORMANCE_STYLES
+        self.setStyleSheet(sheet)
         pal = self.palette()
         pal.setColor(QPalette.ColorRole.WindowText, QColor("#e4e4e7"))
         self.setPalette(pal)
@@ -1032,10 +3235,39 @@ class AppLauncher(QWidget):
         self.favorite_mode = mode
         self.refresh_view()
 
+    def set_category_filter(self, category):
+        """Show only ``category``; selecting the active category clears the filter."""
+        if category == self.category_filter:
+            category = None
+        self.category_filter = category
+        self.filter_chip.setText(f"{category}  ✕" if category else "")
+        self.filter_chip.setVisible(category is not None)
+        self.refresh_view()
+
+    def show_all_apps(self):
+        self.favorite_mode = 0
+        self.category_filter = None
+        self.filter_chip.setVisible(False)
+        if self.search_input.text():
+            self.search_input.clear()  # refreshes through the search debounce
+        else:
+            self.refresh_view()
+
+    def category_members(self) -> frozenset[int] | None:
+        # Copied on the UI thread so the search worker never sees the set change
+        if self.category_filter is None:
+            return None
+        return frozenset(self.catalog.by_category.get(self.category_filter, ()))
+
     def show_settings(self):
         dialog = SettingsDialog(self, self.settings)
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            performance_mode = self.settings.get("performance_mode", False)
             self.settings = dialog.result_settings
+            if self.settings["performance_mode"] != performance_mode:
+                self.apply_styles()
+                self.apply_performance_mode()
+            self.config_writer.storage = self.settings.get("storage", "json")
             self.save_config()
             self.show_toast("Settings saved")
 
@@ -1236,6 +3468,11 @@ class AppLauncher(QWidget):
         icon = self.windowIcon()
         self.tray_icon = QSystemTrayIcon(icon, self)
         self.tray_menu = QMenu()
+        self.tray_menu.aboutToShow.connect(self.update_tray_menu)
+        self.tray_show_action = QAction("Show Launcher", self)
+        self.tray_show_action.triggered.connect(self.showNormal)
+        self.tray_quit_action = QAction("Quit", self)
+        self.tray_quit_action.triggered.connect(QApplication.instance().quit)
         self.tray_icon.setContextMenu(self.tray_menu)
         self.tray_icon.activated.connect(self.on_tray_click)
         self.tray_icon.show()
@@ -1251,23 +3488,45 @@ class AppLauncher(QWidget):
                 self.hide()
 
     def update_tray_menu(self):
-        if not self.tray_menu:
+        """Rebuild the tray menu if favorites, names or recent launches changed.
+
+        Launch actions are kept per app id and reused across rebuilds.
+        """
+        if not self.tray_menu or not self.tray_dirty:
             return
+        favs = self.resolve_apps(self.search_index.all_ranked(favorites_only=True, k=TRAY_FAVORITES)
+                                 .materialize(TRAY_FAVORITES))
+        fav_ids = {app["id"] for app in favs}
+        # most launched first, ties going to the latest launch
+        launches = self.recent_launches
+        frequent = sorted(reversed(launches), key=launches.__getitem__, reverse=True)
+        recent = [app for app in self.resolve_apps(frequent) if app["id"] not in fav_ids][:TRAY_RECENT]
+
+        actions = {}
         self.tray_menu.clear()
-        show_act = QAction("Show Launcher", self)
-        show_act.triggered.connect(self.showNormal)
-        self.tray_menu.addAction(show_act)
-        favs = [a for a in self.apps if a.get("favorite")]
-        if favs:
-            self.tray_menu.addSeparator()
-            for app in favs[:10]:
-                act = QAction(f"Launch: {app['name']}", self)
-                act.triggered.connect(lambda _, aid=app["id"]: self.launch_app(aid))
+        self.tray_menu.addAction(self.tray_show_action)
+        for title, apps in (("Favorites", favs), ("Recent", recent)):
+            if not apps:
+                continue
+            self.tray_menu.addSection(title)
+            for app in apps:
+                act = self.tray_actions.pop(app["id"], None)
+                if act is None:
+                    act = QAction(self)
+                    act.triggered.connect(lambda _, aid=app["id"]: self.launch_app(aid))
+                set_text(act, f"Launch: {app['name']}")
+                if act.icon().isNull():
+                    pixmap = self.icon_loader.request(app)
+                    if pixmap is not None and pixmap is not IconLoader.LOADING:
+                        act.setIcon(QIcon(pixmap))
+                actions[app["id"]] = act
                 self.tray_menu.addAction(act)
+        for act in self.tray_actions.values():
+            act.deleteLater()
+        self.tray_actions = actions
         self.tray_menu.addSeparator()
-        quit_act = QAction("Quit", self)
-        quit_act.triggered.connect(QApplication.instance().quit)
-        self.tray_menu.addAction(quit_act)
+        self.tray_menu.addAction(self.tray_quit_action)
+        self.tray_dirty = False
 
     def closeEvent(self, event):
         if self.tray_icon and self.settings.get("minimize_to_tray", True):
@@ -1286,6 +3545,13 @@ class AppLauncher(QWidget):
             if self.sidebar.width() == 0:
                 self.toggle_sidebar(force_expand=True)
         super().resizeEvent(event)
+        self.schedule_card_fill()
+
+    def apply_performance_mode(self):
+        """Switch the effects the style sheet cannot: animations and grid hover."""
+        enabled = bool(self.settings.get("performance_mode", False))
+        self.setProperty("performance_mode", enabled)
+        self.grid_view.set_effects(not enabled)
 
     def toggle_sidebar(self, checked=False, force_collapse=False, force_expand=False):
         width = self.sidebar.width()
@@ -1300,6 +3566,11 @@ class AppLauncher(QWidget):
         if width == end_width:
             return
 
+        if self.property("performance_mode"):
+            self.sidebar.setMinimumWidth(end_width)
+            self.sidebar.setMaximumWidth(end_width)
+            return
+
         self.anim_sidebar = QPropertyAnimation(self.sidebar, b"maximumWidth")
         self.anim_sidebar.setDuration(300)
         self.anim_sidebar.setStartValue(width)
@@ -1315,75 +3586,123 @@ class AppLauncher(QWidget):
         self.anim_sidebar.start()
         self.anim_sidebar_min.start()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.release_timer.stop()
+        if self.view_stale:
+            self.view_stale = False
+            self.refresh_view()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.card_fill_timer.stop()
+        seconds = float(self.settings.get("hidden_release_s", HIDDEN_RELEASE_S))
+        if seconds > 0:
+            self.release_timer.start(int(seconds * 1000))
+
+    def release_view(self):
+        """Drop the cards, grid rows and decoded pixmaps of a view nobody is looking at."""
+        if self.isVisible():
+            return
+        self.clear_cards()
+        self.grid_model.set_apps([])
+        self.filtered_apps = []
+        self.icon_loader.cache.clear()
+        self.search_session.clear()
+        QPixmapCache.clear()
+        self.view_stale = True
+
     def changeEvent(self, event):
         if event.type() == QEvent.Type.WindowStateChange:
             if self.isMinimized():
                 self.hide()
+        elif event.type() == QEvent.Type.DevicePixelRatioChange:
+            self.update_icon_dpr()
         super().changeEvent(event)
 
+    def update_icon_dpr(self):
+        """Re-request icons at the window's device pixel ratio if it changed."""
+        dpr = self.devicePixelRatioF()
+        if dpr == self.icon_loader.dpr:
+            return
+        self.icon_loader.dpr = dpr
+        self.icon_loader.forget()
+        for app_id in self.shown_card_ids:
+            self.card_pool[app_id].set_icon_visual()
+        self.grid_view.viewport().update()
+
     # ------- Mode & Refresh -------
 
-    def _ordered_apps(self, query: str) -> list[dict]:
-        favs = [a for a in self.apps if a.get("favorite")]
-        non_favs = [a for a in self.apps if not a.get("favorite")]
+    def current_query(self) -> str:
+        return self.search_input.text().strip().lower()
 
-        # favorite_mode
-        if self.favorite_mode == 2:  # favorites only
-            base = favs
-        else:
-            base = favs + non_favs  # normal & favs-first same ordering
+    def schedule_search(self, _text=None):
+        # restarting the timer coalesces a burst of keystrokes into one search
+        self.search_timer.start()
+
+    def refresh_view(self):
+        """Rank the current query on the search pool; the view updates when it finishes.
+
+        While the window is hidden this only marks the view stale.
+        """
+        self.search_timer.stop()
+        self.grid_model.stop_fetching()  # its results may name apps that are gone
+        if not self.isVisible():
+            self.view_stale = True
+            return
+        self.search_generation += 1
+        self.search_pool.clear()  # drop searches that have not started yet
+        self.search_pool.start(SearchTask(
+            self.search_generation,
+            self.search_session,
+            self.current_query(),
+            self.favorite_mode == 2,
+            self.search_signals,
+            lambda: self.search_generation,
+            self.category_filter,
+            self.category_members(),
+        ))
 
-        if not query:
-            return base
+    def on_search_finished(self, generation, query, results):
+        if generation != self.search_generation:
+            return  # a newer search has been requested since
+        if not self.isVisible():
+            self.view_stale = True  # hidden while it ran
+            return
+        self.show_results(generation, query, results)
 
-        # fuzzy filter
-        scored = []
-        for app in base:
-            text = f"{app.get('name','')} {app.get('category','')}"
-            score = fuzzy_score(text, query)
-            if score > 0:
-                scored.append((score, app))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [a for _, a in scored]
+    def resolve_apps(self, ids) -> list[dict]:
+        apps = self.search_index.apps
+        return [apps[app_id] for app_id in ids if app_id in apps]
 
-    def refresh_view(self):
-        # Clear existing items
-        while self.flow_layout.count():
-            item = self.flow_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        query = self.search_input.text().strip().lower()
-        apps = self._ordered_apps(query)
+    def show_results(self, generation, query, results):
+        self.published_generation = generation
+        use_grid = len(self.catalog) >= VIRTUAL_GRID_THRESHOLD
+        if use_grid:
+            apps = self.resolve_apps(results.materialize(SEARCH_TOP_K)[:SEARCH_TOP_K])
+        else:
+            apps = self.resolve_apps(results.materialize(len(results)))
         self.filtered_apps = apps
         
         # Toggle Empty State
-        if not apps and not query:
+        if not apps and not query and self.category_filter is None:
             self.scroll_area.hide()
+            self.grid_view.hide()
             self.empty_state.show()
         else:
             self.empty_state.hide()
-            self.scroll_area.show()
-
-        callbacks = {
-            "launch": self.launch_app,
-            "toggle_fav": self.toggle_favorite,
-            "edit": self.edit_app,
-            "delete": self.delete_app
-        }
-
-        for app in apps:
-            card = AppCardWidget(app, callbacks)
-            
-            # highlight favourites softly (extra border or glow)
-            # highlight favourites softly (extra border or glow)
-            if app.get("favorite"):
-                card.setStyleSheet(
-                    "#AppCard { border: 1px solid #fbbf24; background: #27272a; }"
-                )
-            
-            self.flow_layout.addWidget(card)
+            self.scroll_area.setVisible(not use_grid)
+            self.grid_view.setVisible(use_grid)
+
+        if use_grid:
+            # Large catalogs only hand the result list to the model; the view
+            # paints whatever fits in the viewport.
+            self.clear_cards()
+            self.grid_model.set_results(results, self.resolve_apps)
+            self.grid_view.icon_retain_timer.start()
+        else:
+            self.grid_model.set_apps([])
+            self.sync_cards(apps)
 
         # suggestion / mode display
         if apps and query:
@@ -1395,64 +3714,158 @@ class AppLauncher(QWidget):
         else:
             self.suggestion_label.setVisible(False)
 
-        self.update_tray_menu()
         self.update_sidebar_categories()
 
+    def sync_cards(self, apps: list[dict]):
+        """Lay out ``apps`` as cards, building widgets only near the viewport.
+
+        Cards are built down to one viewport below the fold; the rest of the
+        list is held by tile-sized spacers, and fill_cards builds more as
+        scrolling reaches them.
+        """
+        self.card_apps = apps
+        self.place_cards(min(len(apps), self.cards_wanted()))
+
+    def place_cards(self, limit: int):
+        """Reconcile the card pool with ``card_apps[:limit]``, keyed by app id.
+
+        Existing cards are patched and reordered in place; only ids without a
+        card get a new AppCardWidget, and cards that dropped out are hidden.
+        """
+        self.card_limit = limit
+        cards = []
+        shown_ids = set()
+        for app in self.card_apps[:limit]:
+            card = self.card_pool.get(app["id"])
+            if card is None:
+                card = AppCardWidget(app, self.card_callbacks, self.scroll_content)
+                self.card_pool[app["id"]] = card
+            else:
+                card.set_app_data(app)
+            cards.append(card)
+            shown_ids.add(app["id"])
+
+        # Showing a child re-runs its parent's layout; do it once for the batch
+        self.flow_layout.setEnabled(False)
+        for app_id in self.shown_card_ids - shown_ids:
+            card = self.card_pool.get(app_id)
+            if card is not None:
+                card.hide()
+                self.icon_loader.cancel(app_id)
+        for app_id in shown_ids - self.shown_card_ids:
+            card = self.card_pool[app_id]
+            card.show()
+            if not card.icon_loaded:
+                card.request_icon()
+        self.flow_layout.setEnabled(True)
+        self.flow_layout.setWidgets(cards, len(self.card_apps) - limit, QSize(TILE_WIDTH, TILE_HEIGHT))
+        self.flow_layout.activate()
+        self.shown_card_ids = shown_ids
+
+    def cards_wanted(self) -> int:
+        """How many cards fill the viewport plus the margin below it."""
+        viewport = self.scroll_area.viewport()
+        bottom = self.scroll_area.verticalScrollBar().value() + (1 + CARD_MARGIN_VIEWPORTS) * viewport.height()
+        columns = max(1, (viewport.width() + TILE_SPACING) // (TILE_WIDTH + TILE_SPACING))
+        rows = bottom // (TILE_HEIGHT + TILE_SPACING) + 1
+        return columns * rows
+
+    def schedule_card_fill(self, *_):
+        if self.card_limit < len(self.card_apps) and not self.card_fill_timer.isActive():
+            self.card_fill_timer.start(0)
+
+    def fill_cards(self):
+        """Build the next cards the viewport needs, yielding to the event loop every CARD_BATCH_MS."""
+        wanted = min(len(self.card_apps), self.cards_wanted())
+        if wanted <= self.card_limit:
+            return
+        deadline = time.perf_counter() + CARD_BATCH_MS / 1000
+        limit = self.card_limit
+        while limit < wanted and time.perf_counter() < deadline:
+            app = self.card_apps[limit]
+            if app["id"] not in self.card_pool:
+                self.card_pool[app["id"]] = AppCardWidget(app, self.card_callbacks, self.scroll_content)
+            limit += 1
+        self.place_cards(limit)
+        if limit < wanted:
+            self.card_fill_timer.start(0)
+
+    def on_icon_ready(self, app_id, pixmap):
+        card = self.card_pool.get(app_id)
+        if card is not None:
+            card.set_icon_pixmap(pixmap)
+        self.grid_model.icon_changed(app_id)
+        act = self.tray_actions.get(app_id)
+        if act is not None and pixmap is not None:
+            act.setIcon(QIcon(pixmap))
+
+    def drop_card(self, app_id):
+        self.icon_loader.cancel(app_id)
+        card = self.card_pool.pop(app_id, None)
+        self.shown_card_ids.discard(app_id)
+        if card is not None:
+            card.hide()
+            card.deleteLater()
+
+    def clear_cards(self):
+        self.card_apps = []
+        self.card_limit = 0
+        self.card_fill_timer.stop()
+        if not self.card_pool:
+            return
+        self.flow_layout.setWidgets([])
+        for app_id in list(self.card_pool):
+            self.drop_card(app_id)
+
     def update_sidebar_categories(self):
-        # Clear existing buttons
-        while self.category_buttons_layout.count():
-            item = self.category_buttons_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-        
-        # Get unique categories
-        categories = sorted(list(set(app.get("category", "General") for app in self.apps)))
-        if not categories:
-            categories = ["General"]
-            
+        if self.sidebar_version != self.catalog.version:
+            self.sync_category_buttons()
+
         current_query = self.search_input.text().strip()
-            
-        # Add "All Apps" button
-        all_btn = QPushButton("All Apps")
-        all_btn.setObjectName("SidebarButton")
-        all_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        all_btn.setIcon(QIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirHomeIcon)))
-        
-        # Active if no query and not in fav mode
-        if not current_query and self.favorite_mode == 0:
-            all_btn.setProperty("active", True)
-            
-        all_btn.clicked.connect(lambda: (self.search_input.clear(), self.set_favorite_mode(0)))
-        self.category_buttons_layout.addWidget(all_btn)
-        
-        # Add "Favorites" button
-        fav_btn = QPushButton("Favorites")
-        fav_btn.setObjectName("SidebarButton")
-        fav_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        fav_btn.setIcon(QIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogYesButton)))
-        
-        # Active if in fav mode
-        if self.favorite_mode != 0:
-            fav_btn.setProperty("active", True)
-            
-        fav_btn.clicked.connect(lambda: self.toggle_favorite_mode())
-        self.category_buttons_layout.addWidget(fav_btn)
-        
-        # Add category buttons
-        for cat in categories:
-            btn = QPushButton(cat)
-            btn.setObjectName("SidebarButton")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setIcon(QIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon)))
-            
-            # Active if query matches category
-            if current_query == cat:
-                btn.setProperty("active", True)
-                
-            # Use default argument to capture current cat
-            btn.clicked.connect(lambda checked, c=cat: (self.search_input.setText(c), self.set_favorite_mode(0)))
-            self.category_buttons_layout.addWidget(btn)
+        # Active if nothing narrows the list
+        set_active(self.all_btn, not current_query and self.category_filter is None and self.favorite_mode == 0)
+        set_active(self.fav_btn, self.favorite_mode != 0)
+        for cat, btn in self.category_buttons.items():
+            set_active(btn, self.category_filter == cat)
+
+    def sidebar_button(self, icon) -> QPushButton:
+        btn = QPushButton()
+        btn.setObjectName("SidebarButton")
+        btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        btn.setIcon(icon if isinstance(icon, QIcon) else QIcon(self.style().standardIcon(icon)))
+        return btn
+
+    def sync_category_buttons(self):
+        """Match the category buttons and counts to the catalog's category index.
+
+        Buttons are only created or removed when a category appears or
+        disappears; otherwise at most their labels change.
+        """
+        counts = {cat: len(ids) for cat, ids in self.catalog.by_category.items()} or {"General": 0}
+        for cat in [c for c in self.category_buttons if c not in counts]:
+            btn = self.category_buttons.pop(cat)
+            self.category_buttons_layout.removeWidget(btn)
+            btn.deleteLater()
+        if self.category_filter is not None and self.category_filter not in self.catalog.by_category:
+            self.set_category_filter(None)  # its last app is gone
+
+        names = sorted(self.category_buttons)
+        first_row = self.category_buttons_layout.indexOf(self.fav_btn) + 1
+        for cat in sorted(counts):
+            btn = self.category_buttons.get(cat)
+            if btn is None:
+                btn = self.sidebar_button(self.category_icon)
+                # Use default argument to capture current cat
+                btn.clicked.connect(lambda checked, c=cat: self.set_category_filter(c))
+                position = bisect.bisect(names, cat)
+                names.insert(position, cat)
+                self.category_buttons_layout.insertWidget(first_row + position, btn)
+                self.category_buttons[cat] = btn
+            set_text(btn, f"{cat} ({counts[cat]})")
+
+        set_text(self.all_btn, f"All Apps ({len(self.catalog)})")
+        set_text(self.fav_btn, f"Favorites ({len(self.catalog.favorites)})")
+        self.sidebar_version = self.catalog.version
 
     # ------- CRUD -------
 
@@ -1475,18 +3888,16 @@ class AppLauncher(QWidget):
         if not ok:
             return
 
-        app = {
-            "id": self.next_id,
-            "name": name.strip(),
-            "path": file_path,
-            "category": category.strip(),
-            "icon_path": "",
-            "favorite": False
-        }
-        
-        self.apps.append(app)
-        self.next_id += 1
-        self.save_config()
+        with self.search_session.lock:  # the search pool reads the index
+            app = self.catalog.add({
+                "name": name.strip(),
+                "path": file_path,
+                "category": category.strip(),
+                "icon_path": "",
+                "favorite": False
+            })
+            self.search_index.add(app)
+        self.save_config({"op": "add", "app": app.to_dict()})
         self.refresh_view()
         self.show_toast(f"✓ Added {name.strip()}")
 
@@ -1500,10 +3911,7 @@ class AppLauncher(QWidget):
         dialog = EditAppDialog(self, app)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.result_data
-            
-            app["name"] = data["name"]
-            app["category"] = data["category"]
-            app["path"] = data["path"]
+            changes = {"name": data["name"], "category": data["category"], "path": data["path"]}
             
             # Handle icon update
             new_icon_path = data["icon_path"]
@@ -1520,15 +3928,26 @@ class AppLauncher(QWidget):
                         ext = os.path.splitext(new_icon_path)[1] or ".png"
                         dst = os.path.join(ICON_DIR, f"{app['id']}{ext}")
                         shutil.copy2(new_icon_path, dst)
-                        app["icon_path"] = dst
+                        changes["icon_path"] = dst
                     else:
-                        app["icon_path"] = new_icon_path
+                        changes["icon_path"] = new_icon_path
                 except Exception:
-                    app["icon_path"] = new_icon_path # Fallback to original path on error
+                    changes["icon_path"] = new_icon_path # Fallback to original path on error
             elif not new_icon_path:
-                app["icon_path"] = ""
-
-            self.save_config()
+                changes["icon_path"] = ""
+
+            with self.search_session.lock:
+                app = self.catalog.update(app_id, **changes)
+                self.search_index.update(app)
+            self.icon_loader.forget(app_id)
+            card = self.card_pool.get(app_id)
+            if card is not None:
+                card.set_icon_visual()  # the icon file may have been replaced in place
+            act = self.tray_actions.get(app_id)
+            if act is not None:
+                act.setIcon(QIcon())
+            self.tray_dirty = True
+            self.save_config({"op": "edit", "app": app.to_dict()})
             self.refresh_view()
 
     def delete_app(self, app_id):
@@ -1548,32 +3967,47 @@ class AppLauncher(QWidget):
                     os.remove(icon_path)
                 except Exception:
                     pass
-            self.apps = [a for a in self.apps if a["id"] != app_id]
-            self.save_config()
+            with self.search_session.lock:
+                self.catalog.remove(app_id)
+                self.search_index.remove(app_id)
+            self.drop_card(app_id)
+            self.icon_loader.forget(app_id)
+            self.recent_launches.pop(app_id, None)
+            self.tray_dirty = True
+            self.save_config({"op": "delete", "id": app_id})
             self.refresh_view()
 
     def toggle_favorite(self, app_id):
         app = self.get_app(app_id)
         if not app:
             return
-        app["favorite"] = not app.get("favorite", False)
-        self.save_config()
+        with self.search_session.lock:
+            self.catalog.update(app_id, favorite=not app.get("favorite", False))
+            self.search_index.update(app)
+        self.tray_dirty = True
+        self.save_config({"op": "favorite", "id": app_id, "value": app["favorite"]})
         self.refresh_view()
 
     def launch_app(self, app_id):
         app = self.get_app(app_id)
         if not app:
             return
-        try:
-            open_file_cross_platform(app["path"])
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        if self.launch_executor.launch(app_id, app["path"]):
+            self.show_toast(f"🚀 Launching {app.get('name', 'App')}")
 
-    def get_app(self, app_id):
-        for app in self.apps:
-            if app.get("id") == app_id:
-                return app
-        return None
+    def on_app_launched(self, app_id, seconds):
+        self.recent_launches[app_id] = self.recent_launches.pop(app_id, 0) + 1
+        if len(self.recent_launches) > TRAY_RECENT_HISTORY:
+            self.recent_launches.popitem(last=False)
+        self.tray_dirty = True
+
+    def on_launch_failed(self, app_id, error):
+        app = self.get_app(app_id)
+        name = app.get("name", "App") if app else "App"
+        self.show_toast(f"Could not launch {name}: {error}", 4000)
+
+    def get_app(self, app_id) -> AppRecord | None:
+        return self.catalog.get(app_id)
 
     # ------- Utils -------
 
@@ -1597,6 +4031,16 @@ class AppLauncher(QWidget):
         return default, False
 
     def launch_top_match(self):
+        if self.search_timer.isActive() or self.published_generation != self.search_generation:
+            # The visible results are behind the search box; rank the current
+            # text right here so Enter never launches a stale match.
+            self.search_timer.stop()
+            self.search_generation += 1
+            query = self.current_query()
+            ranked = self.search_session.ranked(
+                query, self.favorite_mode == 2, self.category_filter, self.category_members()
+            )
+            self.show_results(self.search_generation, query, ranked)
         if not self.filtered_apps:
             return
         top = self.filtered_apps[0]
@@ -11,6 +11,9 @@ setup(
         "pyinstaller>=6.3"
 
     ],
+    extras_require={
+        "fast": ["numpy>=1.24"]
+    },
     include_package_data=True,
     entry_points={
         "gui_scripts": [
@@ -0,0 +1,99 @@
+"""BatchScorer must agree with the scalar scorer it replaces for large candidate sets."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PyQt6")
+
+import main  # noqa: E402
+
+
+WORDS = ["code", "visual", "studio", "écran", "ﬁle", "Straße", "git", "term", "co", "", "dev tools"]
+
+
+def make_apps(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": app_id,
+            "name": " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))),
+            "category": rng.choice(["Dev", "Games", "Office", ""]),
+            "favorite": rng.random() < 0.1,
+        }
+        for app_id in range(1, count + 1)
+    ]
+
+
+def scalar_buckets(index, query, candidates):
+    buckets = {}
+    for app_id in candidates:
+        score = main.folded_score(index.texts[app_id], query)
+        if score >= 5 * len(query) + 30 + min(len(query), 10):
+            buckets.setdefault(score, set()).add(app_id)
+    return buckets
+
+
+def as_sets(buckets):
+    return {score: set(ids) for score, ids in buckets.items() if ids}
+
+
+@pytest.fixture(scope="module")
+def index():
+    return main.SearchIndex(make_apps(3000))
+
+
+QUERIES = ["co", "c", "code", "vs", "ecran", "écran", "file", "strasse", "dev", "zzz", "o o"]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_scores_match_folded_score(index, query):
+    q = main.normalize_text(query)
+    batch = index.batch_scorer()
+    scores = batch.scores(q)
+    for app_id, score in zip(batch.ids.tolist(), scores.tolist()):
+        assert score == main.folded_score(index.texts[app_id], q)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_buckets_match_search(index, query, monkeypatch):
+    q = main.normalize_text(query)
+    expected = scalar_buckets(index, q, index.texts)
+    assert as_sets(index.batch_scorer().buckets(q)) == expected
+
+    monkeypatch.setattr(main.SearchIndex, "BATCH_MIN_CANDIDATES", 0)
+    assert as_sets(index.search(query)) == expected
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_restricted_candidates(index, query, monkeypatch):
+    q = main.normalize_text(query)
+    dev = {app_id for app_id, app in index.apps.items() if app["category"] == "Dev"}
+    candidates = index.candidates(q, dev)
+    expected = scalar_buckets(index, q, candidates)
+    assert as_sets(index.batch_scorer().buckets(q, candidates)) == expected
+
+    monkeypatch.setattr(main.SearchIndex, "BATCH_MIN_CANDIDATES", 0)
+    assert as_sets(index.search(query, candidates)) == expected
+
+
+def test_batch_is_rebuilt_after_edits():
+    index = main.SearchIndex(make_apps(50))
+    index.batch_scorer()
+    index.add({"id": 1000, "name": "Zebra", "category": "Dev", "favorite": False})
+    assert 1000 in index.batch_scorer().buckets("zeb").get(main.folded_score("zebra dev", "zeb"), [])
+
+
+def test_batch_built_during_an_edit_is_not_kept(monkeypatch):
+    index = main.SearchIndex(make_apps(50))
+    build = main.BatchScorer.__init__
+
+    def edit_while_building(self, ids, texts):
+        build(self, ids, texts)
+        index.update({"id": 1, "name": "Zebra", "category": "Dev", "favorite": False})
+
+    monkeypatch.setattr(main.BatchScorer, "__init__", edit_while_building)
+    index.batch_scorer()
+    monkeypatch.setattr(main.BatchScorer, "__init__", build)
+    assert 1 in set().union(*index.batch_scorer().buckets("zebra").values())